@@ -1,132 +1,96 @@
 # dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
-import time
-import pandas as pd
-import re
+import argparse
 import os
-
-# Configurações iniciais
-navegador = webdriver.Chrome()
-navegador.get('https://www.mistral.com.br/especiais/best-buys')
-time.sleep(2)
-
-# Aceita modal de boas-vindas
+import sys
+from datetime import datetime
+
+import requests
+
+from coleta_http import coletar_http
+from dados import salvar_tratados
+from historico import CAMINHO_IDENTIDADES, anexar_coleta, migrar_ids
+from identidade import ResolvedorIdentidade
+from instrumentacao import RelatorioExecucao, perfilar
+from limpeza import limpar_dataframe
+
+URL_BEST_BUYS = 'https://www.mistral.com.br/especiais/best-buys'
+# Abaixo disso a coleta é tratada como falha (layout mudou, acesso bloqueado) e nada é publicado
+MINIMO_PRODUTOS = 1
+
+parser = argparse.ArgumentParser(description='Coleta e tratamento dos vinhos Best Buys da Mistral.')
+parser.add_argument('--motor', choices=['http', 'selenium'], default='http',
+                    help='http baixa o HTML direto (padrão); selenium abre o Chrome')
+parser.add_argument('--relatorio', default=f'../relatorios/execucao_{datetime.now():%Y%m%d_%H%M%S}.json',
+                    help='arquivo JSON com tempos por etapa e contadores da execução')
+parser.add_argument('--minimo-produtos', type=int, default=MINIMO_PRODUTOS,
+                    help='menor número de produtos para a coleta ser gravada e publicada')
+parser.add_argument('--perfil', default=None, help='grava as estatísticas do cProfile neste arquivo')
+args = parser.parse_args()
+
+relatorio = RelatorioExecucao()
+
+# O relatório é gravado mesmo quando a execução falha: é justamente nesse caso que ele é consultado
 try:
-    botao_aceitar = navegador.find_element(By.XPATH, '//*[@id="pg-modal-bemvindo"]/div/a[1]')
-    botao_aceitar.click()
-    time.sleep(1)
-except NoSuchElementException:
-    print("Modal de boas-vindas não encontrado.")
-
-# Aceita cookies
-try:
-    botao_aceitar_cookies = navegador.find_element(By.XPATH, '//*[@id="lgpd-cookies"]/div/a')
-    botao_aceitar_cookies.click()
-    time.sleep(1)
-except NoSuchElementException:
-    print("Botão de cookies não encontrado.")
-
-# Aplica filtro
-try:
-    botao_filtro = navegador.find_element(By.XPATH, '//*[@id="selectOrdem"]')
-    botao_filtro.click()
-    time.sleep(0.5)
-    menor = navegador.find_element(By.XPATH, '//*[@id="selectOrdem"]/option[2]')
-    menor.click()
-    time.sleep(2)
-except NoSuchElementException:
-    print("Filtro de ordenação não encontrado.")
-
-# Coletar produtos
-lista_produtos = []
-for produto in range(0, 35):
-    try:
-        xpath = f'/html/body/div[14]/section/article[2]/div[1]/div/div[{produto}]/div[2]/div[4]/a/h2'
-        dado_produto = navegador.find_element(By.XPATH, xpath).text
-    except NoSuchElementException:
-        try:
-            xpath = f'/html/body/div[15]/section/article[2]/div[1]/div/div[{produto}]/div[2]/div[4]/a/h2'
-            dado_produto = navegador.find_element(By.XPATH, xpath).text
-        except NoSuchElementException:
-            continue
-    if dado_produto:
-        lista_produtos.append(dado_produto)
-
-# Coletar ml
-lista_ml = []
-for ml in range(0, 35):
-    try:
-        xpath = f'/html/body/div[14]/section/article[2]/div[1]/div/div[{ml}]/div[2]/div[2]/p'
-        texto = navegador.find_element(By.XPATH, xpath).text
-    except NoSuchElementException:
-        try:
-            xpath = f'/html/body/div[15]/section/article[2]/div[1]/div/div[{ml}]/div[2]/div[2]/p'
-            texto = navegador.find_element(By.XPATH, xpath).text
-        except NoSuchElementException:
-            continue
-    numeros = re.findall(r'\d+', texto)
-    if numeros:
-        lista_ml.append(int(numeros[0]))
-
-# Coletar preços
-lista_precos = []
-for preco in range(0, 35):
-    try:
-        xpath = f'/html/body/div[14]/section/article[2]/div[1]/div/div[{preco}]/div[2]/div[4]/a/p[4]'
-        texto = navegador.find_element(By.XPATH, xpath).text
-    except NoSuchElementException:
-        try:
-            xpath = f'/html/body/div[15]/section/article[2]/div[1]/div/div[{preco}]/div[2]/div[4]/a/p[4]'
-            texto = navegador.find_element(By.XPATH, xpath).text
-        except NoSuchElementException:
-            continue
-    numeros = re.findall(r'\d+', texto)
-    if numeros:
-        lista_precos.append(float(numeros[0]))
-
-# Coletar parcelas
-lista_parcela = []
-for parcela in range(0, 35):
-    try:
-        xpath = f'/html/body/div[14]/section/article[2]/div[1]/div/div[{parcela}]/div[2]/div[4]/p/b[1]'
-        dado_parcela = navegador.find_element(By.XPATH, xpath).text
-    except NoSuchElementException:
-        try:
-            xpath = f'/html/body/div[15]/section/article[2]/div[1]/div/div[{parcela}]/div[2]/div[4]/p/b[1]'
-            dado_parcela = navegador.find_element(By.XPATH, xpath).text
-        except NoSuchElementException:
-            continue
-    numero_parcela = re.findall(r'\d+', dado_parcela)
-    if numero_parcela:
-        lista_parcela.append(numero_parcela[0])
-
-# Criando DataFrames
-tabela1 = pd.DataFrame(lista_produtos, columns=['Produto'])
-tabela2 = pd.DataFrame(lista_ml, columns=['Volume (ML)'])
-tabela3 = pd.DataFrame(lista_precos, columns=['Precos'])
-tabela4 = pd.DataFrame(lista_parcela, columns=['Parcela'])
-
-df_original = pd.concat([tabela1, tabela2, tabela3, tabela4], axis=1)
-os.makedirs('../bases_originais', exist_ok=True)
-df_original.to_csv('../bases_originais/dados_brutos.csv', sep=';', index=True, encoding='UTF-8')
-
-df = df_original.copy()
-df.fillna(0, inplace=True)
-
-# Tratando duplicatas
-df = df.drop_duplicates()
-
-# Tratando outliers
-df.loc[df['Precos'] > 999, 'Precos'] = 999
-df.loc[df['Precos'] < 0, 'Precos'] = 0
-
-os.makedirs('../bases_tratadas', exist_ok=True)
-df.to_csv('../bases_tratadas/dados_tratados.csv', sep=';', index=True, encoding='UTF-8')
-
-# Encerra o navegador
-navegador.quit()
-
-print("Coleta e tratamento finalizados com sucesso!")
\ No newline at end of file
+    with perfilar(args.perfil):
+        # Coletar produtos
+        motor = args.motor
+        if motor == 'http':
+            try:
+                df_original = coletar_http(URL_BEST_BUYS, relatorio=relatorio)
+            except requests.RequestException as e:
+                print(f"Erro na coleta HTTP: {e}")
+                relatorio.registrar('erro_http', str(e))
+                df_original = None
+            if df_original is None or df_original.empty:
+                print("Nenhum produto encontrado via HTTP, usando o navegador.")
+                motor = 'selenium'
+
+        if motor == 'selenium':
+            from coleta_selenium import coletar_selenium
+            try:
+                df_original = coletar_selenium(URL_BEST_BUYS, relatorio=relatorio)
+            except ImportError as e:
+                # O selenium é importado dentro da coleta e não está no requirements.txt: os workers
+                # de ingestão não têm nem ele nem o Chrome
+                print(f"Coleta com o navegador indisponível neste ambiente ({e}). Nada foi gravado.")
+                relatorio.registrar('erro_selenium', str(e))
+                sys.exit(2)
+        relatorio.registrar('motor', motor)
+
+        # Uma coleta vazia publicada trocaria a base do dashboard por uma tabela sem linhas
+        produtos = 0 if df_original is None else len(df_original)
+        if produtos < args.minimo_produtos:
+            print(f"Coleta com {produtos} produto(s), abaixo do mínimo de {args.minimo_produtos}. "
+                  "Nada foi gravado; a versão publicada continua a anterior.")
+            relatorio.registrar('erro_coleta', f'{produtos} produtos (mínimo {args.minimo_produtos})')
+            sys.exit(3)
+
+        with relatorio.etapa('gravacao_brutos'):
+            os.makedirs('../bases_originais', exist_ok=True)
+            df_original.to_csv('../bases_originais/.dados_brutos.csv.tmp', sep=';', index=True, encoding='UTF-8')
+            os.replace('../bases_originais/.dados_brutos.csv.tmp', '../bases_originais/dados_brutos.csv')
+
+        # Guarda a coleta no histórico de preços (cada execução vira um novo arquivo, nada é sobrescrito)
+        with relatorio.etapa('gravacao_historico'):
+            resolvedor = ResolvedorIdentidade.carregar(CAMINHO_IDENTIDADES)
+            migrar_ids(resolvedor=resolvedor)
+            anexar_coleta(df_original, resolvedor=resolvedor)
+            resolvedor.salvar(CAMINHO_IDENTIDADES)
+        relatorio.registrar('produtos_conhecidos', len(resolvedor))
+
+        with relatorio.etapa('limpeza'):
+            df = limpar_dataframe(df_original, relatorio=relatorio)
+
+        with relatorio.etapa('gravacao_tratados'):
+            os.makedirs('../bases_tratadas', exist_ok=True)
+            versao = salvar_tratados(df, '../bases_tratadas/dados_tratados.csv')
+        relatorio.registrar('versao_publicada', versao)
+except Exception as e:
+    relatorio.registrar('erro', f'{type(e).__name__}: {e}')
+    raise
+finally:
+    relatorio.salvar(args.relatorio)
+    print(f"Relatório da execução salvo em {args.relatorio}")
+
+print("Coleta e tratamento finalizados com sucesso!")
@@ -0,0 +1,79 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import argparse
+import fcntl
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+PASTA_CODIGOS = os.path.dirname(os.path.abspath(__file__))
+TRAVA = os.path.join(PASTA_CODIGOS, '..', 'bases_tratadas', '.atualizacao.lock')
+
+
+def _adquirir_trava(caminho):
+    """
+    Trava exclusiva (flock) sobre o arquivo; retorna o descritor aberto, ou None se outra
+    atualização estiver em andamento. O sistema libera a trava quando o descritor é fechado
+    ou o processo morre (kill -9, falta de memória, reinício do contêiner), então um arquivo
+    que ficou para trás não impede as próximas atualizações.
+    """
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    descritor = os.open(caminho, os.O_CREAT | os.O_RDWR)
+    try:
+        fcntl.flock(descritor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(descritor)
+        return None
+    os.ftruncate(descritor, 0)
+    os.write(descritor, str(os.getpid()).encode('ascii'))
+    return descritor
+
+
+def executar_atualizacao(argumentos=(), timeout=None, compactar=True):
+    """
+    Roda coleta + tratamento (AP2.py) em um processo separado. O AP2 grava a base em
+    arquivos temporários, troca-os com os.replace e publica um novo token de versão,
+    que o dashboard percebe na próxima interação sem precisar reiniciar.
+    Depois de uma atualização bem-sucedida, e ainda com a trava, compacta as partições
+    do histórico dos dias anteriores (historico.py --compactar).
+    """
+    trava = _adquirir_trava(TRAVA)
+    if trava is None:
+        print(f"[{datetime.now():%H:%M:%S}] Atualização anterior ainda em andamento, pulando.")
+        return None
+    try:
+        inicio = time.monotonic()
+        processo = subprocess.run([sys.executable, 'AP2.py', *argumentos], cwd=PASTA_CODIGOS, timeout=timeout)
+        duracao = time.monotonic() - inicio
+        situacao = 'ok' if processo.returncode == 0 else f'falhou (código {processo.returncode})'
+        print(f"[{datetime.now():%H:%M:%S}] Atualização {situacao} em {duracao:.1f}s.")
+        if processo.returncode == 0 and compactar:
+            subprocess.run([sys.executable, 'historico.py', '--compactar'], cwd=PASTA_CODIGOS)
+        return processo.returncode
+    except subprocess.TimeoutExpired:
+        print(f"[{datetime.now():%H:%M:%S}] Atualização excedeu {timeout}s e foi interrompida.")
+        return None
+    finally:
+        # O arquivo fica no lugar; só a trava é liberada
+        os.close(trava)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Atualiza a base periodicamente em segundo plano.')
+    parser.add_argument('--intervalo', type=float, default=60, help='minutos entre atualizações')
+    parser.add_argument('--uma-vez', action='store_true', help='executa uma atualização e sai')
+    parser.add_argument('--timeout', type=float, default=None, help='segundos máximos por atualização')
+    parser.add_argument('--sem-compactar', action='store_true',
+                        help='não compacta o histórico depois de cada atualização')
+    parser.add_argument('argumentos', nargs=argparse.REMAINDER, help='repassados ao AP2.py (ex.: -- --motor selenium)')
+    args = parser.parse_args()
+    argumentos = [a for a in args.argumentos if a != '--']
+
+    while True:
+        proxima = time.monotonic() + args.intervalo * 60
+        executar_atualizacao(argumentos, timeout=args.timeout, compactar=not args.sem_compactar)
+        if args.uma_vez:
+            break
+        time.sleep(max(0.0, proxima - time.monotonic()))
@@ -0,0 +1,216 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from dados import carregar_tratados
+from estatisticas import resumo_dataset, versao_dataset
+
+CAMINHO_TRATADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'bases_tratadas',
+                                'dados_tratados.csv')
+TAMANHO_PAGINA = 1000
+MAX_TAMANHO_PAGINA = 50_000
+MAX_RANKING = 1000
+
+
+def _para_json(valor):
+    """Converte tipos do NumPy/pandas para JSON (NaN vira null)."""
+    if isinstance(valor, dict):
+        return {str(chave): _para_json(item) for chave, item in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_para_json(item) for item in valor]
+    if isinstance(valor, (np.integer,)):
+        return int(valor)
+    if isinstance(valor, (float, np.floating)):
+        return None if math.isnan(valor) else float(valor)
+    return valor
+
+
+def _registros(df):
+    # Colunas float32 da base compacta passam pelo texto para não exporem o ruído da conversão
+    df = df.assign(**{coluna: df[coluna].astype(str).astype('float64')
+                      for coluna in df.columns if df[coluna].dtype == 'float32'})
+    return _para_json(df.astype(object).where(df.notna(), None).to_dict(orient='records'))
+
+
+class BaseConsultas:
+    """
+    Mantém a base carregada (a mesma leitura compacta usada pelo app) e as respostas já
+    serializadas da versão atual, em uma única tupla (publicada, versao, df, respostas) trocada
+    de uma vez quando a base muda, então uma requisição nunca vê a versão antiga com a base nova.
+    `publicada` é o que versao_dataset devolveu na carga e só serve para perceber a próxima
+    troca; `versao` é o token gravado dentro do Feather lido, usado no corpo e no ETag. Os dois
+    podem diferir (token ainda não publicado, ou .versao.json ausente) sem causar recargas.
+    """
+
+    def __init__(self, caminho_csv=CAMINHO_TRATADOS):
+        self.caminho_csv = caminho_csv
+        self._estado = (None, None, None, {})
+        self._trava_carga = threading.Lock()
+        self._trava_respostas = threading.Lock()
+
+    def atual(self):
+        """(versao, df, respostas) da base publicada, recarregando-a se ela mudou."""
+        publicada = versao_dataset(self.caminho_csv)
+        estado = self._estado
+        if estado[0] != publicada:
+            with self._trava_carga:
+                estado = self._estado
+                if estado[0] != publicada:
+                    df = carregar_tratados(self.caminho_csv, compacto=True)
+                    # O token é publicado logo depois da troca dos arquivos; a versão gravada no
+                    # próprio Feather é a que corresponde ao que foi lido
+                    estado = (publicada, df.attrs.get('versao', publicada), df, {})
+                    self._estado = estado
+        return estado[1:]
+
+    def etag(self, versao, chave):
+        resumo = hashlib.sha1(f'{versao}|{chave}'.encode('UTF-8')).hexdigest()[:20]
+        return f'"{resumo}"'
+
+    def resposta(self, chave, calcular):
+        """Corpo JSON (bytes) e ETag da consulta, calculados uma vez por versão da base."""
+        versao, df, respostas = self.atual()
+        guardada = respostas.get(chave)
+        if guardada is None:
+            corpo = json.dumps(_para_json({'versao': versao, **calcular(df)}), ensure_ascii=False).encode('UTF-8')
+            with self._trava_respostas:
+                guardada = respostas.setdefault(chave, (corpo, self.etag(versao, chave)))
+        return guardada
+
+
+def consulta_resumo(df):
+    resumo = resumo_dataset(df)
+    colunas = {}
+    for coluna, medidas in resumo['colunas'].items():
+        if medidas['tipo'] == 'numerica':
+            colunas[coluna] = {chave: medidas[chave] for chave in
+                               ('validos', 'media', 'desvio', 'mediana', 'minimo', 'maximo', 'q1', 'q3', 'outliers')}
+    return {
+        'linhas': resumo['linhas'],
+        'preco_medio': colunas.get('Precos', {}).get('media'),
+        'volume_medio': colunas.get('Volume (ML)', {}).get('media'),
+        'colunas': colunas,
+    }
+
+
+def consulta_parcelas(df):
+    contagem = df['Parcela'].value_counts().sort_index()
+    return {'parcelas': [{'parcelas': int(valor), 'vinhos': int(n)} for valor, n in contagem.items()]}
+
+
+def consulta_ranking(df, ordem, n):
+    if ordem == 'maiores':
+        selecionados = df.nlargest(n, 'Precos')
+    else:
+        selecionados = df.nsmallest(n, 'Precos')
+    return {'ordem': ordem, 'vinhos': _registros(selecionados)}
+
+
+class Manipulador(BaseHTTPRequestHandler):
+    base = None
+    server_version = 'ConsultasVinhos/1.0'
+
+    def log_message(self, formato, *args):
+        pass
+
+    def _enviar_json(self, status, corpo, etag=None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(corpo)))
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def _erro(self, status, mensagem):
+        self._enviar_json(status, json.dumps({'erro': mensagem}, ensure_ascii=False).encode('UTF-8'))
+
+    def _nao_modificado(self, etag):
+        if etag in [valor.strip() for valor in self.headers.get('If-None-Match', '').split(',')]:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return True
+        return False
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        parametros = {chave: valores[-1] for chave, valores in parse_qs(url.query).items()}
+        try:
+            if url.path == '/resumo':
+                self._responder('resumo', consulta_resumo)
+            elif url.path == '/parcelas':
+                self._responder('parcelas', consulta_parcelas)
+            elif url.path == '/ranking':
+                ordem = parametros.get('ordem', 'maiores')
+                if ordem not in ('maiores', 'menores'):
+                    return self._erro(400, "ordem deve ser 'maiores' ou 'menores'")
+                n = min(max(int(parametros.get('n', 10)), 1), MAX_RANKING)
+                self._responder(f'ranking|{ordem}|{n}', lambda df: consulta_ranking(df, ordem, n))
+            elif url.path == '/linhas':
+                pagina = max(int(parametros.get('pagina', 1)), 1)
+                tamanho = min(max(int(parametros.get('tamanho', TAMANHO_PAGINA)), 1), MAX_TAMANHO_PAGINA)
+                self._exportar_linhas(pagina, tamanho, parametros.get('todas') == '1')
+            else:
+                self._erro(404, 'consultas disponíveis: /resumo, /parcelas, /ranking, /linhas')
+        except ValueError as e:
+            self._erro(400, str(e))
+        except FileNotFoundError:
+            self._erro(503, 'base tratada não encontrada')
+
+    def _responder(self, chave, calcular):
+        corpo, etag = self.base.resposta(chave, calcular)
+        if not self._nao_modificado(etag):
+            self._enviar_json(200, corpo, etag)
+
+    def _exportar_linhas(self, pagina, tamanho, todas):
+        """
+        Exporta linhas em JSON Lines com transferência chunked: uma página, ou todas a partir
+        dela com `todas=1`, gerando o texto bloco a bloco em vez de montar a resposta inteira.
+        """
+        versao, df, _ = self.base.atual()
+        etag = self.base.etag(versao, f'linhas|{pagina}|{tamanho}|{todas}')
+        if self._nao_modificado(etag):
+            return
+        inicio = (pagina - 1) * tamanho
+        fim = len(df) if todas else min(inicio + tamanho, len(df))
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson; charset=utf-8')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.send_header('ETag', etag)
+        self.send_header('X-Total-Linhas', str(len(df)))
+        self.end_headers()
+        for bloco_inicio in range(inicio, fim, tamanho):
+            bloco = df.iloc[bloco_inicio:min(bloco_inicio + tamanho, fim)]
+            texto = ''.join(json.dumps(registro, ensure_ascii=False) + '\n' for registro in _registros(bloco))
+            dados = texto.encode('UTF-8')
+            self.wfile.write(f'{len(dados):X}\r\n'.encode('ascii') + dados + b'\r\n')
+        self.wfile.write(b'0\r\n\r\n')
+
+
+def servir(host='127.0.0.1', porta=8502, caminho_csv=CAMINHO_TRATADOS):
+    Manipulador.base = BaseConsultas(caminho_csv)
+    Manipulador.protocol_version = 'HTTP/1.1'
+    servidor = ThreadingHTTPServer((host, porta), Manipulador)
+    print(f'Consultas disponíveis em http://{host}:{porta}/resumo')
+    servidor.serve_forever()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='API de consulta somente leitura sobre a base tratada.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=8502)
+    parser.add_argument('--base', default=CAMINHO_TRATADOS, help='caminho de dados_tratados.csv')
+    args = parser.parse_args()
+    servir(args.host, args.porta, args.base)
@@ -1,20 +1,34 @@
 #dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
 
+import threading
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import numpy as np 
 
-@st.cache_data
-def load_data():
+from dados import carregar_tratados
+from estatisticas import contingencia, eh_categorica, eh_numerica, resumo_bivariado, resumo_dataset, versao_dataset
+from filtros import IndiceFiltros
+from memoria import formatar_bytes, memoria_objetos, memoria_por_coluna
+from graficos import (LINHAS_POR_PAGINA, barras_categorias, boxplot, boxplot_grupos, dispersao, histograma,
+                      mapa_correlacoes, pagina)
+
+CAMINHO_TRATADOS = 'bases_tratadas/dados_tratados.csv'
+#CAMINHO_TRATADOS = '../bases_tratadas/dados_tratados.csv'
+
+@st.cache_resource(max_entries=2)
+def load_data(versao, colunas=None):
     """
-    Carrega os dados tratados do arquivo CSV.
-    Assume que o arquivo foi salvo com index=True, então a primeira coluna é o índice.
-    Converte colunas relevantes para tipos numéricos e trata possíveis erros.
+    Carrega os dados tratados. `versao` identifica o arquivo em disco e faz parte da chave
+    do cache, então uma base regravada é recarregada sem reiniciar o Streamlit.
+    Lê o arquivo Feather gravado ao lado do CSV (já tipado e mapeado em memória),
+    opcionalmente só com as colunas pedidas. Sem ele, lê o CSV e converte os tipos.
+    As colunas vêm em tipos compactos (Produto categórico, int16/int32, float32) e o
+    DataFrame é um só, compartilhado por todas as sessões: ele nunca deve ser modificado,
+    só filtrado (o que gera um novo DataFrame).
     """
     try:
-        df = pd.read_csv('bases_tratadas/dados_tratados.csv', sep=';', encoding='UTF-8', index_col=0)
-        #df = pd.read_csv('../bases_tratadas/dados_tratados.csv', sep=';', encoding='UTF-8', index_col=0)
+        df = carregar_tratados(CAMINHO_TRATADOS, colunas=colunas, compacto=True)
     except FileNotFoundError:
         st.error("Arquivo 'bases_tratadas/dados_tratados.csv' não encontrado. "
                  "Verifique o caminho ou se a Parte 1 do script foi executada e o arquivo foi salvo corretamente.")
@@ -23,64 +37,150 @@ def load_data():
         st.error(f"Erro ao carregar os dados: {e}")
         return pd.DataFrame()
 
-    if 'Volume (ML)' in df.columns:
-        df['Volume (ML)'] = pd.to_numeric(df['Volume (ML)'], errors='coerce').fillna(0).astype(int)
-    if 'Precos' in df.columns:
-        df['Precos'] = pd.to_numeric(df['Precos'], errors='coerce').fillna(0)
-    if 'Parcela' in df.columns:
-        df['Parcela'] = pd.to_numeric(df['Parcela'], errors='coerce').fillna(0).astype(int)
-    
-    df.replace([np.inf, -np.inf], np.nan, inplace=True)
-
     return df
 
-df = load_data()
+@st.cache_resource(max_entries=2)
+def load_indice(versao):
+    """Índices ordenados e nomes codificados usados pelos filtros, montados uma vez por versão da base."""
+    return IndiceFiltros(load_data(versao))
+
+def dados_filtrados(versao, filtros):
+    df = load_data(versao)
+    if not filtros:
+        return df
+    return df[load_indice(versao).mascara(filtros)]
+
+@st.cache_data(max_entries=16)
+def load_estatisticas(versao, filtros=()):
+    """Resumo de todas as colunas, calculado uma vez por versão da base e combinação de filtros."""
+    return resumo_dataset(dados_filtrados(versao, filtros))
+
+@st.cache_data(max_entries=16)
+def load_bivariado(versao, filtros=()):
+    """Correlações, quartis por categoria e tabelas de contingência, calculados uma vez por versão e filtros."""
+    return resumo_bivariado(dados_filtrados(versao, filtros))
+
+@st.cache_resource
+def estado_versoes():
+    """Versão já pronta para uso e versão sendo preparada, compartilhadas por todas as sessões."""
+    return {'pronta': None, 'aquecendo': None, 'trava': threading.Lock()}
+
+def aquecer(versao):
+    """Carrega a base, o índice e as estatísticas sem filtros de uma versão para os caches."""
+    load_data(versao)
+    load_indice(versao)
+    load_estatisticas(versao)
+    load_bivariado(versao)
+
+def _aquecer_em_segundo_plano(versao):
+    estado = estado_versoes()
+    try:
+        aquecer(versao)
+        with estado['trava']:
+            estado['pronta'] = versao
+    finally:
+        with estado['trava']:
+            if estado['aquecendo'] == versao:
+                estado['aquecendo'] = None
+
+def versao_em_uso():
+    """
+    Versão da base que esta execução deve mostrar. Quando o agendador publica uma versão nova,
+    ela é preparada em uma thread enquanto as sessões continuam usando os objetos já em cache
+    da versão anterior; a troca acontece na primeira interação depois que a nova fica pronta.
+    Só a primeira carga (sem versão anterior para mostrar) é feita na própria execução.
+    """
+    versao_disco = versao_dataset(CAMINHO_TRATADOS)
+    estado = estado_versoes()
+    with estado['trava']:
+        pronta = estado['pronta']
+        if pronta is not None and pronta != versao_disco and estado['aquecendo'] != versao_disco:
+            estado['aquecendo'] = versao_disco
+            threading.Thread(target=_aquecer_em_segundo_plano, args=(versao_disco,), daemon=True).start()
+    if pronta is None:
+        aquecer(versao_disco)
+        with estado['trava']:
+            estado['pronta'] = pronta = versao_disco
+    return pronta, estado['aquecendo']
+
+def filtros_barra_lateral(indice):
+    """Monta os filtros da barra lateral e devolve só os ativos, como tupla (chave do cache)."""
+    st.sidebar.header("Filtros")
+    filtros = []
+    termo = st.sidebar.text_input('Buscar vinho pelo nome')
+    if termo.strip():
+        filtros.append(('nome', termo.strip()))
+    for coluna in indice.colunas:
+        limites = indice.limites(coluna)
+        if limites is None or limites[0] == limites[1]:
+            continue
+        escolhido = st.sidebar.slider(coluna, min_value=limites[0], max_value=limites[1], value=limites)
+        if tuple(escolhido) != limites:
+            filtros.append((coluna, escolhido[0], escolhido[1]))
+    return tuple(filtros)
+
+versao, versao_nova = versao_em_uso()
+df = load_data(versao)
 
 if not df.empty:
     st.title("Análise de Vinhos Best Buys Mistral")
     st.markdown("Uma aplicação interativa para explorar os dados de vinhos com melhor custo-benefício da Mistral.")
 
+    st.sidebar.caption(f"Versão da base: {versao}")
+    if versao_nova:
+        st.sidebar.caption(f"Preparando a versão {versao_nova}...")
+    filtros = filtros_barra_lateral(load_indice(versao))
+    if filtros:
+        df = dados_filtrados(versao, filtros)
+        st.caption(f"{len(df)} vinhos atendem aos filtros selecionados.")
+    if df.empty:
+        st.warning("Nenhum vinho atende aos filtros selecionados.")
+        st.stop()
+
     st.subheader('Dados Brutos')
-    st.dataframe(df)
+    total_paginas = max(1, -(-len(df) // LINHAS_POR_PAGINA))
+    numero_pagina = st.number_input(f'Página (de {total_paginas})', min_value=1, max_value=total_paginas, value=1)
+    st.dataframe(pagina(df, numero_pagina))
+
+    estatisticas = load_estatisticas(versao, filtros)
 
     st.subheader('Análise de Valores Nulos')
-    aux_nulos = df.isnull().sum().reset_index()
-    aux_nulos.columns = ['Variável', 'Quantidade de Nulos']
-    st.dataframe(aux_nulos)
+    st.dataframe(estatisticas['nulos'])
 
     st.subheader('Análises Univariadas')
     st.write('Medidas Resumo')
-    try:
-        st.dataframe(df.describe(include='all'))
-    except Exception as e:
-        st.error(f"Erro ao gerar medidas resumo: {e}")
+    if estatisticas['descricao'] is not None:
+        st.dataframe(estatisticas['descricao'])
+    else:
+        st.error(f"Erro ao gerar medidas resumo: {estatisticas['erro_descricao']}")
 
-    valid_columns_for_analysis = [col for col in df.columns if df[col].isnull().sum() < len(df[col])]
+    valid_columns_for_analysis = estatisticas['colunas_validas']
 
     coluna_univariada = st.selectbox('Escolha uma coluna para análise univariada', valid_columns_for_analysis)
 
     if coluna_univariada and coluna_univariada in df.columns:
-        if df[coluna_univariada].notna().sum() == 0:
+        resumo = estatisticas['colunas'][coluna_univariada]
+        if resumo['validos'] == 0:
             st.warning(f"A coluna '{coluna_univariada}' não possui dados válidos para análise.")
-        elif pd.api.types.is_numeric_dtype(df[coluna_univariada]):
-            media_univariada = round(df[coluna_univariada].mean(skipna=True), 2)
-            desvio_univariada = round(df[coluna_univariada].std(skipna=True), 2)
-            mediana_univariada = round(df[coluna_univariada].median(skipna=True), 2)
-            maximo_univariada = round(df[coluna_univariada].max(skipna=True), 2)
-            minimo_univariada = round(df[coluna_univariada].min(skipna=True), 2)
+        elif resumo['tipo'] == 'numerica':
+            media_univariada = round(resumo['media'], 2)
+            desvio_univariada = round(resumo['desvio'], 2)
+            mediana_univariada = round(resumo['mediana'], 2)
+            maximo_univariada = round(resumo['maximo'], 2)
+            minimo_univariada = round(resumo['minimo'], 2)
 
             st.write(f'A coluna escolhida foi **{coluna_univariada}**. A sua média é **{media_univariada}**. O desvio padrão é **{desvio_univariada}**. A mediana é **{mediana_univariada}**. O valor máximo é **{maximo_univariada}** e o mínimo é **{minimo_univariada}**.')
 
             st.subheader(f'Histograma de {coluna_univariada}')
-            if df[coluna_univariada].notna().sum() > 0:
-                fig_hist = px.histogram(df, x=coluna_univariada, title=f'Distribuição de {coluna_univariada}')
+            if resumo['validos'] > 0:
+                fig_hist = histograma(resumo, coluna_univariada)
                 st.plotly_chart(fig_hist)
             else:
                 st.write("Não há dados suficientes para gerar o histograma.")
 
             st.subheader(f'Boxplot de {coluna_univariada}')
-            if df[coluna_univariada].notna().sum() > 0:
-                fig_box = px.box(df, y=coluna_univariada, title=f'Boxplot de {coluna_univariada}')
+            if resumo['validos'] > 0:
+                fig_box = boxplot(resumo, coluna_univariada)
                 st.plotly_chart(fig_box)
             else:
                 st.write("Não há dados suficientes para gerar o boxplot.")
@@ -89,8 +189,8 @@ if not df.empty:
             explicacao_univariada = ""
 
             explicacao_univariada += f"O **histograma de {coluna_univariada}** mostra a frequência (contagem) de vinhos em diferentes faixas de valores para esta variável. "
-            if df[coluna_univariada].notna().sum() > 0:
-                skewness = df[coluna_univariada].skew()
+            if resumo['validos'] > 0:
+                skewness = resumo['assimetria']
                 if pd.notna(skewness):
                     if skewness > 0.5:
                         explicacao_univariada += f"A distribuição parece ser **assimétrica à direita** (skewness de {skewness:.2f}). Isso sugere que há uma concentração de valores mais baixos e uma cauda mais longa de valores mais altos. Nestes casos, a média ({media_univariada}) tende a ser maior que a mediana ({mediana_univariada}). "
@@ -102,31 +202,27 @@ if not df.empty:
                     explicacao_univariada += "Não foi possível calcular a assimetria (skewness) para esta coluna. "
 
             explicacao_univariada += f"\n\nO **boxplot de {coluna_univariada}** oferece um resumo visual da distribuição. "
-            if df[coluna_univariada].notna().sum() > 0:
-                Q1 = df[coluna_univariada].quantile(0.25)
-                Q3 = df[coluna_univariada].quantile(0.75)
-                IQR = Q3 - Q1
+            if resumo['validos'] > 0:
+                Q1 = resumo['q1']
+                Q3 = resumo['q3']
+                IQR = resumo['iqr']
                 explicacao_univariada += f"A linha central da caixa representa a **mediana ({mediana_univariada})**. A caixa em si abrange o intervalo interquartil (IQR), de Q1 ({Q1:.2f}) a Q3 ({Q3:.2f}), contendo 50% dos dados centrais. A altura da caixa (IQR = {IQR:.2f}) indica a dispersão. "
-                limite_superior_outlier = Q3 + 1.5 * IQR
-                limite_inferior_outlier = Q1 - 1.5 * IQR
-                outliers = df[(df[coluna_univariada] > limite_superior_outlier) | (df[coluna_univariada] < limite_inferior_outlier)]
-                if not outliers.empty:
-                    explicacao_univariada += f"Os pontos fora das 'hastes' (whiskers) são considerados **outliers** (valores atípicos). Foram detectados {len(outliers)} outlier(s) para {coluna_univariada}. "
+                if resumo['outliers'] > 0:
+                    explicacao_univariada += f"Os pontos fora das 'hastes' (whiskers) são considerados **outliers** (valores atípicos). Foram detectados {resumo['outliers']} outlier(s) para {coluna_univariada}. "
                 else:
                     explicacao_univariada += "Não foram detectados outliers significativos com base na regra do 1.5 * IQR. "
             
             st.markdown(explicacao_univariada)
         
-        elif df[coluna_univariada].dtype == 'object':
+        elif resumo['tipo'] == 'categorica':
             st.write(f"A coluna **{coluna_univariada}** é do tipo categórica (texto).")
             st.write("Medidas resumo para colunas categóricas:")
-            st.dataframe(df[coluna_univariada].describe())
+            st.dataframe(resumo['descricao'])
             
             st.subheader(f'Gráfico de Barras de {coluna_univariada}')
-            if df[coluna_univariada].notna().sum() > 0:
-                contagem_categorias = df[coluna_univariada].value_counts().reset_index()
-                contagem_categorias.columns = [coluna_univariada, 'Contagem']
-                fig_bar = px.bar(contagem_categorias, x=coluna_univariada, y='Contagem', title=f'Contagem de Categorias em {coluna_univariada}')
+            if resumo['validos'] > 0:
+                contagem_categorias = resumo['contagem']
+                fig_bar = barras_categorias(contagem_categorias, coluna_univariada)
                 st.plotly_chart(fig_bar)
 
                 st.subheader(f"Interpretação do Gráfico para {coluna_univariada}")
@@ -142,6 +238,12 @@ if not df.empty:
 
 
     st.subheader('Análises Bivariadas')
+    bivariado = load_bivariado(versao, filtros)
+
+    if len(bivariado['numericas']) > 1:
+        st.markdown('**Matriz de Correlação**')
+        st.plotly_chart(mapa_correlacoes(bivariado['correlacoes']))
+
     colunas_bivariadas = st.multiselect('Escolha duas colunas para análise bivariada', valid_columns_for_analysis)
 
     if len(colunas_bivariadas) == 2:
@@ -149,15 +251,15 @@ if not df.empty:
 
         st.markdown(f"### Análise entre: **{coluna_x}** e **{coluna_y}**")
 
-        if pd.api.types.is_numeric_dtype(df[coluna_x]) and pd.api.types.is_numeric_dtype(df[coluna_y]):
+        if eh_numerica(df[coluna_x]) and eh_numerica(df[coluna_y]):
             st.markdown('**Gráfico de Dispersão**')
-            fig_scatter = px.scatter(df, x=coluna_x, y=coluna_y, title=f'Dispersão entre {coluna_x} e {coluna_y}')
+            fig_scatter = dispersao(df, coluna_x, coluna_y)
             st.plotly_chart(fig_scatter)
 
             st.subheader(f"Interpretação do Gráfico de Dispersão ({coluna_x} vs {coluna_y})")
             explicacao_scatter = f"O gráfico de dispersão entre **{coluna_x}** e **{coluna_y}** mostra a relação entre estas duas variáveis numéricas. Cada ponto representa um vinho.\n"
             try:
-                correlacao = df[coluna_x].corr(df[coluna_y])
+                correlacao = bivariado['correlacoes'].loc[coluna_x, coluna_y]
                 if pd.notna(correlacao):
                     explicacao_scatter += f"A correlação de Pearson entre elas é de **{correlacao:.2f}**. "
                     if abs(correlacao) > 0.7:
@@ -184,9 +286,10 @@ if not df.empty:
         else:
             st.info(f"Para um gráfico de dispersão significativo e cálculo de correlação, ambas as colunas ({coluna_x}, {coluna_y}) deveriam ser numéricas. Se uma é categórica, considere o boxplot abaixo.")
 
-        if df[coluna_x].dtype == 'object' and pd.api.types.is_numeric_dtype(df[coluna_y]):
+        if eh_categorica(df[coluna_x]) and eh_numerica(df[coluna_y]):
             st.markdown('**Boxplot Comparativo**')
-            fig_box_cat = px.box(df, x=coluna_x, y=coluna_y, title=f'Boxplot de {coluna_y} por {coluna_x}')
+            quartis = bivariado['grupos'][(coluna_x, coluna_y)]
+            fig_box_cat = boxplot_grupos(quartis, coluna_x, coluna_y)
             st.plotly_chart(fig_box_cat)
 
             st.subheader(f"Interpretação do Boxplot ({coluna_y} por {coluna_x})")
@@ -198,7 +301,7 @@ if not df.empty:
                 f"- **Outliers (pontos individuais):** Se algumas categorias de '{coluna_x}' têm mais valores extremos (muito altos ou muito baixos) de '{coluna_y}' do que outras.\n"
             )
             try:
-                medianas_por_categoria = df.groupby(coluna_x)[coluna_y].median().dropna().sort_values()
+                medianas_por_categoria = quartis['mediana'].dropna().sort_values()
                 if not medianas_por_categoria.empty:
                     explicacao_boxplot_bi += (f"Por exemplo, a categoria '{medianas_por_categoria.index[0]}' em '{coluna_x}' apresenta a menor mediana para '{coluna_y}' ({medianas_por_categoria.iloc[0]:.2f}), "
                                               f"enquanto a categoria '{medianas_por_categoria.index[-1]}' tem a maior mediana ({medianas_por_categoria.iloc[-1]:.2f}). "
@@ -207,9 +310,10 @@ if not df.empty:
                 explicacao_boxplot_bi += f"Não foi possível calcular medianas por categoria para '{coluna_x}' e '{coluna_y}' para um exemplo detalhado."
             st.markdown(explicacao_boxplot_bi)
 
-        elif df[coluna_y].dtype == 'object' and pd.api.types.is_numeric_dtype(df[coluna_x]):
+        elif eh_categorica(df[coluna_y]) and eh_numerica(df[coluna_x]):
             st.markdown('**Boxplot Comparativo**')
-            fig_box_cat = px.box(df, x=coluna_y, y=coluna_x, title=f'Boxplot de {coluna_x} por {coluna_y}')
+            quartis = bivariado['grupos'][(coluna_y, coluna_x)]
+            fig_box_cat = boxplot_grupos(quartis, coluna_y, coluna_x)
             st.plotly_chart(fig_box_cat)
 
             st.subheader(f"Interpretação do Boxplot ({coluna_x} por {coluna_y})")
@@ -221,7 +325,7 @@ if not df.empty:
                 f"- **Outliers (pontos individuais):** Se algumas categorias de '{coluna_y}' têm mais valores extremos de '{coluna_x}'.\n"
             )
             try:
-                medianas_por_categoria = df.groupby(coluna_y)[coluna_x].median().dropna().sort_values()
+                medianas_por_categoria = quartis['mediana'].dropna().sort_values()
                 if not medianas_por_categoria.empty:
                     explicacao_boxplot_bi += (f"Por exemplo, a categoria '{medianas_por_categoria.index[0]}' em '{coluna_y}' apresenta a menor mediana para '{coluna_x}' ({medianas_por_categoria.iloc[0]:.2f}), "
                                               f"enquanto a categoria '{medianas_por_categoria.index[-1]}' tem a maior mediana ({medianas_por_categoria.iloc[-1]:.2f}).")
@@ -229,10 +333,10 @@ if not df.empty:
                 explicacao_boxplot_bi += f"Não foi possível calcular medianas por categoria para '{coluna_y}' e '{coluna_x}' para um exemplo detalhado."
             st.markdown(explicacao_boxplot_bi)
         
-        elif df[coluna_x].dtype == 'object' and df[coluna_y].dtype == 'object':
+        elif eh_categorica(df[coluna_x]) and eh_categorica(df[coluna_y]):
             st.markdown('**Tabela de Contingência (Frequência Cruzada)**')
             try:
-                tabela_contingencia = pd.crosstab(df[coluna_x], df[coluna_y])
+                tabela_contingencia = contingencia(bivariado, coluna_x, coluna_y)
                 st.dataframe(tabela_contingencia)
                 fig_heatmap = px.imshow(tabela_contingencia, title=f'Mapa de Calor da Frequência entre {coluna_x} e {coluna_y}',
                                         labels=dict(color="Contagem"))
@@ -250,7 +354,7 @@ if not df.empty:
             except Exception as e:
                 st.error(f"Não foi possível gerar a tabela de contingência: {e}")
         
-        elif not (pd.api.types.is_numeric_dtype(df[coluna_x]) and pd.api.types.is_numeric_dtype(df[coluna_y])):
+        elif not (eh_numerica(df[coluna_x]) and eh_numerica(df[coluna_y])):
              st.info('Para o boxplot bivariado, uma das colunas selecionadas deve ser do tipo objeto (categórica) e a outra numérica. Se ambas forem numéricas, o gráfico de dispersão acima é mais indicado. Se ambas forem categóricas, uma tabela de contingência é mais apropriada.')
 
     elif len(colunas_bivariadas) != 0 and len(colunas_bivariadas) != 2:
@@ -258,26 +362,45 @@ if not df.empty:
 
     st.sidebar.header("Informações Adicionais do Dataset")
 
-    if 'Precos' in df.columns and pd.api.types.is_numeric_dtype(df['Precos']):
+    resumos = estatisticas['colunas']
+
+    if resumos.get('Precos', {}).get('tipo') == 'numerica':
         st.sidebar.subheader("Preço")
-        preco_medio_filtrado = round(df['Precos'].mean(skipna=True), 2)
-        st.sidebar.write(f"Preço médio geral: **R$ {preco_medio_filtrado}**")
+        preco_medio_filtrado = round(resumos['Precos']['media'], 2)
+        st.sidebar.write(f"Preço médio {'filtrado' if filtros else 'geral'}: **R$ {preco_medio_filtrado}**")
 
-    if 'Volume (ML)' in df.columns and pd.api.types.is_numeric_dtype(df['Volume (ML)']):
+    if resumos.get('Volume (ML)', {}).get('tipo') == 'numerica':
         st.sidebar.subheader("Volume (ML)")
-        volume_medio_filtrado = round(df['Volume (ML)'].mean(skipna=True), 2)
-        st.sidebar.write(f"Volume médio geral: **{volume_medio_filtrado} ML**")
+        volume_medio_filtrado = round(resumos['Volume (ML)']['media'], 2)
+        st.sidebar.write(f"Volume médio {'filtrado' if filtros else 'geral'}: **{volume_medio_filtrado} ML**")
 
-    if 'Parcela' in df.columns and pd.api.types.is_numeric_dtype(df['Parcela']):
+    if resumos.get('Parcela', {}).get('tipo') == 'numerica':
         st.sidebar.subheader("Parcelamento")
-        if df['Parcela'].nunique(dropna=True) > 1:
-            maior_parcela = df['Parcela'].max(skipna=True)
+        if resumos['Parcela']['distintos'] > 1:
+            maior_parcela = resumos['Parcela']['maximo']
             st.sidebar.write(f"Número máximo de parcelas encontrado: **{int(maior_parcela)}**")
-        elif df['Parcela'].nunique(dropna=True) == 1:
-            parcela_unica = df['Parcela'].unique()[0]
+        elif resumos['Parcela']['distintos'] == 1:
+            parcela_unica = resumos['Parcela']['maximo']
             st.sidebar.write(f"Todas as opções de parcelamento são: **{int(parcela_unica)}**")
         else:
             st.sidebar.write("Informação de parcelamento não disponível ou uniforme (após tratamento de nulos).")
+
+    with st.sidebar.expander("Uso de memória"):
+        uso_colunas = memoria_por_coluna(load_data(versao))
+        st.write(f"Base carregada (compartilhada entre sessões): **{formatar_bytes(uso_colunas['Bytes'].sum())}**")
+        uso_colunas['Tamanho'] = uso_colunas['Bytes'].map(formatar_bytes)
+        st.dataframe(uso_colunas[['Coluna', 'Tipo', 'Tamanho']], hide_index=True)
+        objetos_cache = {
+            'Base carregada': load_data(versao),
+            'Índice dos filtros': load_indice(versao),
+            'Estatísticas univariadas': estatisticas,
+            'Estatísticas bivariadas': bivariado,
+        }
+        if filtros:
+            objetos_cache['Base filtrada'] = df
+        uso_objetos = memoria_objetos(objetos_cache)
+        uso_objetos['Tamanho'] = uso_objetos['Bytes'].map(formatar_bytes)
+        st.dataframe(uso_objetos[['Objeto', 'Tamanho']], hide_index=True)
 else:
     st.warning("Os dados não puderam ser carregados. Algumas funcionalidades da aplicação podem não estar disponíveis.")
 
@@ -0,0 +1,194 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import argparse
+import glob
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from dados import carregar_tratados
+from estatisticas import resumo_bivariado, resumo_dataset
+from extracao import extrair_produtos
+from graficos import barras_categorias, boxplot, dispersao, histograma
+from limpeza import limpar_arquivo
+
+TAMANHOS = [1_000, 100_000, 1_000_000, 10_000_000]
+
+PRODUTORES = ['Lagoalva', 'Luis Pato', 'Altano', 'Petit Caro', 'Los Vascos', 'La Vieille Ferme', 'Catena',
+              'Regaleali', 'Lapostolle', 'Alma Negra', 'Famille Perrin', 'El Enemigo', 'DV Catena', 'Braccale',
+              'Coelheiros', 'Dehesa La Granja', 'Château Marjosse', 'Amancaya', 'El Vinculo', 'Saint Felicien',
+              'Basa', 'Bordeaux Signatures', "Graham's", 'Rosso Piceno', 'Beaujolais']
+ESTILOS = ['Tinto', 'Branco', 'Rosé', 'Cabernet Sauvignon', 'Malbec', 'Chardonnay', 'Crianza', 'Reserva',
+           'Gran Reserva', 'Blend', 'Rouge', 'Blanc', "Nero d'Avola", 'Tawny', 'Baga Touriga Nacional']
+
+
+def gerar_catalogo(n, semente=0):
+    """
+    Gera uma base bruta sintética no formato de dados_brutos.csv com n linhas:
+    nomes com cardinalidade realista (distribuição de Zipf), nulos, linhas duplicadas
+    e preços fora do intervalo [0, 999].
+    """
+    rng = np.random.default_rng(semente)
+    n_nomes = max(10, n // 4)
+    produtores = np.array(PRODUTORES)[rng.integers(0, len(PRODUTORES), n_nomes)]
+    estilos = np.array(ESTILOS)[rng.integers(0, len(ESTILOS), n_nomes)]
+    safras = rng.integers(2010, 2024, n_nomes).astype(str)
+    nomes = np.char.add(np.char.add(np.char.add(produtores, ' '), np.char.add(estilos, ' ')), safras)
+    # Alguns nomes aparecem truncados, como no site
+    truncados = rng.random(n_nomes) < 0.05
+    nomes[truncados] = np.char.add(np.char.ljust(nomes[truncados], 35).astype('<U35'), '...')
+
+    indices = np.minimum(rng.zipf(1.3, n) - 1, n_nomes - 1)
+    df = pd.DataFrame({
+        'Produto': nomes[indices],
+        'Volume (ML)': rng.choice([375, 750, 1500], n, p=[0.1, 0.85, 0.05]).astype(float),
+        'Precos': np.round(rng.lognormal(5.3, 0.45, n)),
+        'Parcela': rng.choice([2, 3, 4, 6], n, p=[0.6, 0.25, 0.1, 0.05]).astype(float),
+    })
+
+    # Outliers de preço e valores nulos
+    outliers = rng.random(n) < 0.01
+    df.loc[outliers, 'Precos'] = np.round(rng.uniform(1000, 5000, outliers.sum()))
+    df.loc[rng.random(n) < 0.002, 'Precos'] = -1
+    for coluna, taxa in [('Volume (ML)', 0.1), ('Parcela', 0.2), ('Precos', 0.005)]:
+        df.loc[rng.random(n) < taxa, coluna] = np.nan
+
+    # Linhas duplicadas
+    duplicadas = rng.random(n) < 0.05
+    df.loc[duplicadas, :] = df.iloc[rng.integers(0, n, int(duplicadas.sum()))].to_numpy()
+    return df
+
+
+def gerar_pagina(n_cards=34, semente=0):
+    """HTML sintético com a mesma estrutura da listagem de best-buys."""
+    rng = np.random.default_rng(semente)
+    cards = []
+    for i in range(n_cards):
+        nome = f'{PRODUTORES[i % len(PRODUTORES)]} {ESTILOS[i % len(ESTILOS)]} {rng.integers(2010, 2024)}'
+        cards.append(
+            '<div><div><img src="x.jpg"></div><div><div></div><div><p>750 ml</p></div><div></div>'
+            f'<div><a href="#"><h2>{nome}</h2><p>Tinto</p><p>Portugal</p><p>De R$ 999,00</p>'
+            f'<p>R$ {rng.integers(100, 400)},00</p></a><p>em até <b>{rng.integers(2, 4)}x</b> sem juros</p></div>'
+            '</div></div>'
+        )
+    return ('<html><head><title>Best Buys</title></head><body>' + '<div></div>' * 13
+            + '<div><section><article></article><article><div><div>' + ''.join(cards)
+            + '</div></div></article></section></div></body></html>')
+
+
+def medir(funcao, repeticoes=3):
+    """Menor tempo, em segundos, entre algumas execuções."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def executar(tamanhos, fixtures=None, repeticoes=3):
+    resultados = []
+
+    def registrar(tamanho, etapa, segundos, **extras):
+        resultados.append({'tamanho': tamanho, 'etapa': etapa, 'segundos': round(segundos, 6), **extras})
+        detalhes = ''.join(f'  {chave}={valor}' for chave, valor in extras.items())
+        print(f'{tamanho:>10}  {etapa:<28} {segundos:.4f}s{detalhes}')
+
+    # Parsing do HTML: páginas salvas, se houver, ou uma página sintética
+    paginas = []
+    if fixtures:
+        for caminho in sorted(glob.glob(os.path.join(fixtures, '*.html'))):
+            with open(caminho, encoding='UTF-8') as arquivo:
+                paginas.append(arquivo.read())
+    if not paginas:
+        paginas = [gerar_pagina()]
+    # Os dois seletores: o posicional (HTML do navegador) e o estrutural (HTML do servidor, usado
+    # pela coleta HTTP e pelo crawler). Um tempo baixo com 0 cards significa que nada foi extraído.
+    for etapa, estrutural in [('extracao_html', False), ('extracao_html_estrutural', True)]:
+        cards = sum(len(extrair_produtos(p, estrutural=estrutural)) for p in paginas)
+        segundos = medir(lambda: [extrair_produtos(p, estrutural=estrutural) for p in paginas], repeticoes)
+        registrar(len(paginas), etapa, segundos, cards=cards)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        for tamanho in tamanhos:
+            # As bases grandes são medidas uma vez só
+            rep = repeticoes if tamanho <= 100_000 else 1
+            bruto = os.path.join(pasta, f'bruto_{tamanho}.csv')
+            tratado = os.path.join(pasta, f'tratado_{tamanho}.csv')
+            gerar_catalogo(tamanho).to_csv(bruto, sep=';', index=True, encoding='UTF-8')
+
+            registrar(tamanho, 'limpeza', medir(lambda: limpar_arquivo(bruto, tratado), rep))
+            registrar(tamanho, 'carga_feather', medir(lambda: carregar_tratados(tratado), rep))
+            registrar(tamanho, 'carga_feather_compacta', medir(lambda: carregar_tratados(tratado, compacto=True), rep))
+            os.rename(tratado.replace('.csv', '.feather'), tratado.replace('.csv', '.feather.bak'))
+            registrar(tamanho, 'carga_csv', medir(lambda: carregar_tratados(tratado), rep))
+            os.rename(tratado.replace('.csv', '.feather.bak'), tratado.replace('.csv', '.feather'))
+
+            df = carregar_tratados(tratado, compacto=True)
+            registrar(tamanho, 'estatisticas_univariadas', medir(lambda: resumo_dataset(df), rep))
+            registrar(tamanho, 'estatisticas_bivariadas', medir(lambda: resumo_bivariado(df), rep))
+
+            resumo = resumo_dataset(df)['colunas']
+            registrar(tamanho, 'grafico_histograma', medir(lambda: histograma(resumo['Precos'], 'Precos').to_json(), rep))
+            registrar(tamanho, 'grafico_boxplot', medir(lambda: boxplot(resumo['Precos'], 'Precos').to_json(), rep))
+            registrar(tamanho, 'grafico_dispersao',
+                      medir(lambda: dispersao(df, 'Volume (ML)', 'Precos').to_json(), rep))
+            registrar(tamanho, 'grafico_barras',
+                      medir(lambda: barras_categorias(resumo['Produto']['contagem'], 'Produto').to_json(), rep))
+            os.remove(bruto)
+
+    return resultados
+
+
+def comparar(resultados, anterior, tolerancia):
+    """Lista as etapas que ficaram mais lentas que a execução anterior além da tolerância."""
+    base = {(r['tamanho'], r['etapa']): r['segundos'] for r in anterior['resultados']}
+    regressoes = []
+    for r in resultados:
+        antes = base.get((r['tamanho'], r['etapa']))
+        if antes and r['segundos'] > antes * (1 + tolerancia):
+            regressoes.append({**r, 'anterior': antes, 'variacao': round(r['segundos'] / antes - 1, 3)})
+    return regressoes
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark da coleta, tratamento e análises com dados sintéticos.')
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=TAMANHOS)
+    parser.add_argument('--fixtures', default=None, help='pasta com páginas HTML salvas (*.html)')
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--saida', default=f'../relatorios/benchmark_{datetime.now():%Y%m%d_%H%M%S}.json')
+    parser.add_argument('--comparar', default=None, help='JSON de uma execução anterior')
+    parser.add_argument('--tolerancia', type=float, default=0.2, help='aumento de tempo aceito (0.2 = 20%%)')
+    args = parser.parse_args()
+
+    resultados = executar(args.tamanhos, fixtures=args.fixtures, repeticoes=args.repeticoes)
+    relatorio = {
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'maquina': platform.platform(),
+        'resultados': resultados,
+    }
+
+    codigo_saida = 0
+    if args.comparar:
+        with open(args.comparar, encoding='UTF-8') as arquivo:
+            regressoes = comparar(resultados, json.load(arquivo), args.tolerancia)
+        relatorio['regressoes'] = regressoes
+        for r in regressoes:
+            print(f"Regressão: {r['etapa']} ({r['tamanho']}) {r['anterior']:.4f}s -> {r['segundos']:.4f}s")
+        codigo_saida = 1 if regressoes else 0
+
+    os.makedirs(os.path.dirname(args.saida) or '.', exist_ok=True)
+    with open(args.saida, 'w', encoding='UTF-8') as arquivo:
+        json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
+    print(f'Resultados gravados em {args.saida}')
+    sys.exit(codigo_saida)
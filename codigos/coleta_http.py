@@ -0,0 +1,119 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from extracao import extrair_produtos, montar_tabela
+from instrumentacao import RelatorioExecucao
+
+# Opção do select "selectOrdem" que a coleta com o Chrome clica (menor preço). O nome do
+# parâmetro e o valor da opção são lidos da própria página, não fixados aqui; se o site
+# ignorar o parâmetro, a tabela é ordenada localmente (ver coletar_http).
+OPCAO_MENOR_PRECO = 2
+
+CABECALHOS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml',
+    'Accept-Language': 'pt-BR,pt;q=0.9',
+}
+
+_sessao_padrao = None
+
+
+def criar_sessao(tamanho_pool=10, tentativas=3):
+    """Cria uma sessão HTTP com pool de conexões keep-alive e novas tentativas para erros transitórios."""
+    sessao = requests.Session()
+    retry = Retry(total=tentativas, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    adaptador = HTTPAdapter(pool_connections=tamanho_pool, pool_maxsize=tamanho_pool, max_retries=retry)
+    sessao.mount('http://', adaptador)
+    sessao.mount('https://', adaptador)
+    sessao.headers.update(CABECALHOS)
+    return sessao
+
+
+def sessao_padrao():
+    """Sessão compartilhada pelo processo, para reaproveitar as conexões entre chamadas."""
+    global _sessao_padrao
+    if _sessao_padrao is None:
+        _sessao_padrao = criar_sessao()
+    return _sessao_padrao
+
+
+def baixar_pagina(url, sessao=None, parametros=None, timeout=15):
+    """Baixa o HTML da página com os parâmetros de consulta informados."""
+    sessao = sessao or sessao_padrao()
+    resposta = sessao.get(url, params=parametros, timeout=timeout)
+    resposta.raise_for_status()
+    return resposta.text
+
+
+def parametros_ordem(pagina_html, opcao=OPCAO_MENOR_PRECO):
+    """
+    Parâmetro de consulta equivalente a escolher a `opcao` (1 = primeira) do select
+    "selectOrdem": {name do select: value da opção}. None se a página não tiver o select,
+    se ele não tiver name ou se a opção não existir.
+    """
+    if not pagina_html or not pagina_html.strip():
+        return None
+    selects = lxml_html.fromstring(pagina_html).xpath('//select[@id="selectOrdem"]')
+    if not selects or not selects[0].get('name'):
+        return None
+    opcoes = selects[0].xpath('option')
+    if len(opcoes) < opcao:
+        return None
+    valor = opcoes[opcao - 1].get('value')
+    if valor is None:
+        valor = opcoes[opcao - 1].text_content().strip()
+    return {selects[0].get('name'): valor}
+
+
+def parametro_pagina(pagina_html):
+    """
+    Nome do parâmetro de consulta que a listagem usa para paginar, lido do link para a
+    página 2 (rel="next" ou o link com texto "2"): o parâmetro desse link cujo valor é 2.
+    None se a página não tiver links de paginação (listagem de uma página só).
+    """
+    if not pagina_html or not pagina_html.strip():
+        return None
+    arvore = lxml_html.fromstring(pagina_html)
+    links = arvore.xpath('//a[@rel="next"]/@href')
+    links += [a.get('href') for a in arvore.xpath('//a[@href]') if a.text_content().strip() == '2']
+    for link in links:
+        for nome, valor in parse_qsl(urlsplit(link).query):
+            if valor == '2':
+                return nome
+    return None
+
+
+def coletar_http(url, sessao=None, ordenar=True, limite=None, relatorio=None):
+    """
+    Coleta a listagem sem navegador e devolve o DataFrame Produto / Volume (ML) / Precos / Parcela.
+    Com `ordenar`, baixa a página, lê do "selectOrdem" o parâmetro da opção menor preço e a baixa
+    de novo com ele. Se os preços ainda não vierem em ordem crescente (o site ignorou o parâmetro
+    ou a página não tem o select), a tabela é ordenada localmente, e o relatório registra qual
+    caminho foi usado em vez de devolver dados fora de ordem em silêncio.
+    """
+    relatorio = relatorio or RelatorioExecucao()
+    with relatorio.etapa('carregamento_pagina'):
+        pagina = baixar_pagina(url, sessao=sessao)
+        parametros = parametros_ordem(pagina) if ordenar else None
+        if parametros:
+            relatorio.registrar('parametros_ordem', parametros)
+            pagina = baixar_pagina(url, sessao=sessao, parametros=parametros)
+    relatorio.registrar('tamanho_pagina_bytes', len(pagina))
+
+    with relatorio.etapa('extracao'):
+        tabela = montar_tabela(extrair_produtos(pagina, relatorio=relatorio, estrutural=True))
+    if ordenar:
+        if tabela['Precos'].dropna().is_monotonic_increasing:
+            relatorio.registrar('ordenacao', 'site')
+        else:
+            relatorio.registrar('ordenacao', 'local')
+            tabela = tabela.sort_values('Precos', kind='stable', na_position='last', ignore_index=True)
+    if limite is not None:
+        tabela = tabela.head(limite)
+    return tabela
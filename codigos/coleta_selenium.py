@@ -0,0 +1,68 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import time
+
+from extracao import extrair_produtos, montar_tabela
+from instrumentacao import RelatorioExecucao
+
+
+def coletar_selenium(url, limite=None, relatorio=None):
+    """
+    Coleta a listagem abrindo o Chrome, como na versão original do script.
+    Usado apenas como alternativa quando a coleta HTTP não encontra produtos;
+    o selenium é importado aqui para não ser obrigatório nos workers de ingestão.
+    """
+    relatorio = relatorio or RelatorioExecucao()
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import NoSuchElementException
+
+    with relatorio.etapa('inicio_navegador'):
+        navegador = webdriver.Chrome()
+    try:
+        with relatorio.etapa('carregamento_pagina'):
+            navegador.get(url)
+            time.sleep(2)
+
+        # Aceita modal de boas-vindas
+        with relatorio.etapa('modal'):
+            try:
+                botao_aceitar = navegador.find_element(By.XPATH, '//*[@id="pg-modal-bemvindo"]/div/a[1]')
+                botao_aceitar.click()
+                time.sleep(1)
+                relatorio.contar('elementos_navegador', 'modal_encontrado')
+            except NoSuchElementException:
+                relatorio.contar('elementos_navegador', 'modal_ausente')
+                print("Modal de boas-vindas não encontrado.")
+
+        # Aceita cookies
+        with relatorio.etapa('cookies'):
+            try:
+                botao_aceitar_cookies = navegador.find_element(By.XPATH, '//*[@id="lgpd-cookies"]/div/a')
+                botao_aceitar_cookies.click()
+                time.sleep(1)
+                relatorio.contar('elementos_navegador', 'cookies_encontrado')
+            except NoSuchElementException:
+                relatorio.contar('elementos_navegador', 'cookies_ausente')
+                print("Botão de cookies não encontrado.")
+
+        # Aplica filtro
+        with relatorio.etapa('ordenacao'):
+            try:
+                botao_filtro = navegador.find_element(By.XPATH, '//*[@id="selectOrdem"]')
+                botao_filtro.click()
+                time.sleep(0.5)
+                menor = navegador.find_element(By.XPATH, '//*[@id="selectOrdem"]/option[2]')
+                menor.click()
+                time.sleep(2)
+                relatorio.contar('elementos_navegador', 'ordenacao_encontrado')
+            except NoSuchElementException:
+                relatorio.contar('elementos_navegador', 'ordenacao_ausente')
+                print("Filtro de ordenação não encontrado.")
+
+        with relatorio.etapa('extracao'):
+            pagina = navegador.page_source
+            return montar_tabela(extrair_produtos(pagina, limite=limite, relatorio=relatorio))
+    finally:
+        # Encerra o navegador
+        navegador.quit()
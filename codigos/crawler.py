@@ -0,0 +1,251 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from lxml import etree
+
+from coleta_http import baixar_pagina, criar_sessao, parametro_pagina
+from extracao import COLUNAS, extrair_produtos
+
+URL_BASE = 'https://www.mistral.com.br'
+
+
+class LimitadorTaxa:
+    """Token bucket por host: no máximo `taxa` requisições por segundo, com rajadas de até `capacidade`."""
+
+    def __init__(self, taxa, capacidade=None):
+        self.taxa = taxa
+        self.capacidade = capacidade or max(1.0, taxa)
+        self._baldes = {}
+        self._trava = threading.Lock()
+
+    def aguardar(self, host):
+        while True:
+            with self._trava:
+                agora = time.monotonic()
+                fichas, ultimo = self._baldes.get(host, (self.capacidade, agora))
+                fichas = min(self.capacidade, fichas + (agora - ultimo) * self.taxa)
+                if fichas >= 1:
+                    self._baldes[host] = (fichas - 1, agora)
+                    return
+                self._baldes[host] = (fichas, agora)
+                espera = (1 - fichas) / self.taxa
+            time.sleep(espera)
+
+
+def baixar_com_retentativas(url, sessao, limitador, parametros=None,
+                            tentativas=4, espera_base=0.5, timeout=15):
+    """
+    Baixa uma página respeitando o limitador do host e repetindo com backoff exponencial.
+    Retorna None quando a página não existe (404), o que indica o fim da paginação.
+    """
+    host = urlsplit(url).netloc
+    for tentativa in range(tentativas):
+        limitador.aguardar(host)
+        try:
+            return baixar_pagina(url, sessao=sessao, parametros=parametros, timeout=timeout)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            if tentativa == tentativas - 1:
+                raise
+        except requests.RequestException:
+            if tentativa == tentativas - 1:
+                raise
+        time.sleep(espera_base * 2 ** tentativa + random.uniform(0, espera_base))
+
+
+def _carregar_checkpoint(caminho):
+    if caminho and os.path.exists(caminho):
+        with open(caminho, encoding='UTF-8') as arquivo:
+            estado = json.load(arquivo)
+    else:
+        estado = {}
+    estado.setdefault('concluidas', [])
+    estado.setdefault('finalizadas', [])
+    estado.setdefault('linhas', 0)
+    estado.setdefault('parametros_pagina', {})
+    estado.setdefault('assinaturas', {})
+    return estado
+
+
+def _salvar_checkpoint(caminho, estado):
+    if not caminho:
+        return
+    temporario = caminho + '.tmp'
+    with open(temporario, 'w', encoding='UTF-8') as arquivo:
+        json.dump(estado, arquivo, ensure_ascii=False)
+    os.replace(temporario, caminho)
+
+
+def _chave_pagina(categoria, pagina):
+    # Notação do checkpoint, independente do nome do parâmetro que o site usa
+    return f'{categoria}?pagina={pagina}'
+
+
+def _assinatura(registros):
+    """Identifica o conjunto de produtos de uma página, sem depender da ordem dos cards."""
+    nomes = sorted(str(registro['Produto']) for registro in registros)
+    return hashlib.sha1('\n'.join(nomes).encode('UTF-8')).hexdigest()[:16]
+
+
+def rastrear(categorias, saida, checkpoint=None, trabalhadores=8, taxa=5.0, max_paginas=None,
+             url_base=URL_BASE, parametros=None, sessao=None, tentativas=4, espera_base=0.5):
+    """
+    Percorre todas as páginas de cada categoria com um pool limitado de threads.
+    `parametros` vai em todas as requisições junto com o número da página (ex.: a ordenação
+    devolvida por coleta_http.parametros_ordem).
+    O nome do parâmetro de página é lido dos links de paginação da página 1 de cada categoria
+    (coleta_http.parametro_pagina); sem esses links a categoria tem uma página só.
+    As linhas são gravadas no CSV de saída assim que cada página termina, e o checkpoint
+    guarda as páginas concluídas para que uma execução interrompida possa ser retomada.
+    Uma categoria termina na primeira página sem produtos (ou 404) ou que repete os produtos
+    de outra página (o site ignorou o parâmetro ou devolveu de novo a última página).
+    Uma página que não pôde ser baixada ou lida entra em `falhas` e é pedida de novo na
+    próxima execução.
+    """
+    estado = _carregar_checkpoint(checkpoint)
+    concluidas = set(estado['concluidas'])
+    finalizadas = set(estado['finalizadas'])
+    parametros_pagina = estado['parametros_pagina']
+    assinaturas = estado['assinaturas']
+    sessao = sessao or criar_sessao(tamanho_pool=trabalhadores, tentativas=0)
+    limitador = LimitadorTaxa(taxa)
+
+    proxima = {categoria: 1 for categoria in categorias if categoria not in finalizadas}
+    fim = {}
+    falhas = []
+
+    nova = not os.path.exists(saida) or os.path.getsize(saida) == 0
+    os.makedirs(os.path.dirname(saida) or '.', exist_ok=True)
+    with open(saida, 'a', newline='', encoding='UTF-8') as arquivo, \
+            ThreadPoolExecutor(max_workers=trabalhadores) as executor:
+        escritor = csv.writer(arquivo, delimiter=';')
+        if nova:
+            escritor.writerow([''] + COLUNAS + ['Categoria'])
+
+        pendentes = {}
+
+        def agendar():
+            # Distribui as vagas do pool entre as categorias em rodízio
+            while len(pendentes) < trabalhadores:
+                agendou = False
+                for categoria in list(proxima):
+                    if len(pendentes) >= trabalhadores:
+                        break
+                    pagina = proxima[categoria]
+                    if categoria in fim and pagina > fim[categoria]:
+                        del proxima[categoria]
+                        continue
+                    if max_paginas is not None and pagina > max_paginas:
+                        del proxima[categoria]
+                        continue
+                    if pagina > 1:
+                        if categoria not in parametros_pagina:
+                            # Aguarda a página 1, de onde vem o nome do parâmetro
+                            continue
+                        if parametros_pagina[categoria] is None:
+                            fim[categoria] = min(fim.get(categoria, pagina), pagina)
+                            del proxima[categoria]
+                            continue
+                    proxima[categoria] = pagina + 1
+                    agendou = True
+                    # A página 1 de um checkpoint sem o parâmetro é baixada de novo só para descobri-lo
+                    if _chave_pagina(categoria, pagina) in concluidas and (pagina > 1 or categoria in parametros_pagina):
+                        continue
+                    consulta = dict(parametros or {})
+                    if pagina > 1:
+                        consulta[parametros_pagina[categoria]] = pagina
+                    url = urljoin(url_base, categoria)
+                    futuro = executor.submit(_coletar_pagina, url, pagina, sessao, limitador,
+                                             consulta, tentativas, espera_base)
+                    pendentes[futuro] = (categoria, pagina)
+                if not agendou:
+                    break
+
+        agendar()
+        while pendentes:
+            prontos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in prontos:
+                categoria, pagina = pendentes.pop(futuro)
+                try:
+                    registros, parametro = futuro.result()
+                except (requests.RequestException, etree.LxmlError) as e:
+                    falhas.append({'categoria': categoria, 'pagina': pagina, 'erro': str(e)})
+                    continue
+
+                if pagina == 1:
+                    parametros_pagina[categoria] = parametro
+                if not registros:
+                    fim[categoria] = min(fim.get(categoria, pagina), pagina)
+                    continue
+
+                vistas = assinaturas.setdefault(categoria, {})
+                assinatura = _assinatura(registros)
+                if vistas.get(assinatura, pagina) != pagina:
+                    fim[categoria] = min(fim.get(categoria, pagina), pagina)
+                    continue
+                vistas[assinatura] = pagina
+                if _chave_pagina(categoria, pagina) in concluidas:
+                    continue
+
+                for registro in registros:
+                    escritor.writerow([estado['linhas']] + [registro[c] for c in COLUNAS] + [categoria])
+                    estado['linhas'] += 1
+                arquivo.flush()
+                concluidas.add(_chave_pagina(categoria, pagina))
+                estado['concluidas'] = sorted(concluidas)
+                _salvar_checkpoint(checkpoint, estado)
+            agendar()
+
+    # Só marca como finalizada a categoria cujas páginas anteriores ao fim foram todas coletadas
+    for categoria, ultima in fim.items():
+        if all(_chave_pagina(categoria, p) in concluidas for p in range(1, ultima)):
+            finalizadas.add(categoria)
+    estado['finalizadas'] = sorted(finalizadas)
+    _salvar_checkpoint(checkpoint, estado)
+
+    return {'linhas': estado['linhas'], 'paginas': len(concluidas), 'falhas': falhas}
+
+
+def _coletar_pagina(url, pagina, sessao, limitador, parametros, tentativas, espera_base):
+    """Registros da página e, na página 1, o nome do parâmetro de paginação da categoria."""
+    conteudo = baixar_com_retentativas(url, sessao, limitador, parametros=parametros,
+                                       tentativas=tentativas, espera_base=espera_base)
+    if conteudo is None:
+        return [], None
+    if not conteudo.strip():
+        # Um 200 sem corpo não é o fim da listagem: a página fica em falhas para a próxima execução
+        raise etree.ParserError('resposta sem conteúdo')
+    parametro = parametro_pagina(conteudo) if pagina == 1 else None
+    return extrair_produtos(conteudo, estrutural=True), parametro
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Coleta paginada e concorrente do catálogo da Mistral.')
+    parser.add_argument('--categorias', nargs='+', default=['/especiais/best-buys'],
+                        help='caminhos das categorias, ex.: /especiais/best-buys /vinhos/tintos')
+    parser.add_argument('--saida', default='../bases_originais/catalogo_bruto.csv')
+    parser.add_argument('--checkpoint', default='../bases_originais/catalogo_bruto.checkpoint.json')
+    parser.add_argument('--trabalhadores', type=int, default=8)
+    parser.add_argument('--taxa', type=float, default=5.0, help='requisições por segundo por host')
+    parser.add_argument('--max-paginas', type=int, default=None)
+    parser.add_argument('--url-base', default=URL_BASE)
+    args = parser.parse_args()
+
+    resultado = rastrear(args.categorias, args.saida, checkpoint=args.checkpoint,
+                         trabalhadores=args.trabalhadores, taxa=args.taxa,
+                         max_paginas=args.max_paginas, url_base=args.url_base)
+    print(f"{resultado['linhas']} produtos em {resultado['paginas']} páginas.")
+    for falha in resultado['falhas']:
+        print(f"Falha em {falha['categoria']} página {falha['pagina']}: {falha['erro']}")
@@ -0,0 +1,221 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import json
+import os
+import uuid
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+
+# Esquema explícito da base tratada: os tipos já ficam corretos no arquivo
+ESQUEMA_TRATADOS = pa.schema([
+    ('Produto', pa.string()),
+    ('Volume (ML)', pa.int64()),
+    ('Precos', pa.float64()),
+    ('Parcela', pa.int64()),
+    ('Preco por Litro', pa.float64()),
+    ('Valor Parcela', pa.float64()),
+])
+
+COLUNAS_TRATADOS = ESQUEMA_TRATADOS.names
+
+# Tipos usados em memória pelo dashboard: nomes codificados em dicionário e números reduzidos
+TIPOS_COMPACTOS = {
+    'Produto': pa.dictionary(pa.int32(), pa.string()),
+    'Volume (ML)': pa.int32(),
+    'Precos': pa.float32(),
+    'Parcela': pa.int16(),
+    'Preco por Litro': pa.float32(),
+    'Valor Parcela': pa.float32(),
+}
+
+
+def caminho_colunar(caminho_csv):
+    """Arquivo Arrow/Feather gravado ao lado do CSV tratado."""
+    return os.path.splitext(caminho_csv)[0] + '.feather'
+
+
+def caminho_versao(caminho_csv):
+    """Arquivo com o token da versão publicada da base tratada."""
+    return os.path.splitext(caminho_csv)[0] + '.versao.json'
+
+
+def _temporario(caminho):
+    pasta, nome = os.path.split(caminho)
+    return os.path.join(pasta, f'.{nome}.{os.getpid()}.tmp')
+
+
+def novo_token():
+    return f'{datetime.now():%Y%m%d%H%M%S}-{uuid.uuid4().hex[:8]}'
+
+
+def publicar_versao(caminho_csv, versao=None):
+    """Grava (de forma atômica) o token de versão, que o dashboard usa como chave do cache."""
+    token = {'versao': versao or novo_token(), 'publicado_em': datetime.now().isoformat(timespec='seconds')}
+    destino = caminho_versao(caminho_csv)
+    temporario = _temporario(destino)
+    with open(temporario, 'w', encoding='UTF-8') as arquivo:
+        json.dump(token, arquivo)
+    os.replace(temporario, destino)
+    return token['versao']
+
+
+def ler_versao(caminho_csv):
+    """Token da versão publicada, ou None se a base nunca foi publicada com token."""
+    try:
+        with open(caminho_versao(caminho_csv), encoding='UTF-8') as arquivo:
+            return json.load(arquivo)['versao']
+    except (FileNotFoundError, ValueError, KeyError):
+        return None
+
+
+def calcular_metricas(df):
+    """
+    Métricas derivadas, calculadas uma vez no tratamento: preço por litro e valor de cada parcela.
+    Ficam nulas quando o volume ou o número de parcelas é 0.
+    """
+    df = df.copy()
+    precos = df['Precos'].to_numpy(dtype='float64')
+    volume = df['Volume (ML)'].to_numpy(dtype='float64')
+    parcelas = df['Parcela'].to_numpy(dtype='float64')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        df['Preco por Litro'] = np.where(volume > 0, precos / volume * 1000, np.nan)
+        df['Valor Parcela'] = np.where(parcelas > 0, precos / parcelas, np.nan)
+    return df
+
+
+def tipar_tratados(df):
+    """Converte as colunas da base tratada para os tipos do esquema."""
+    df = df.copy()
+    if 'Produto' in df.columns:
+        df['Produto'] = df['Produto'].where(df['Produto'].isna(), df['Produto'].astype(str))
+    if 'Volume (ML)' in df.columns:
+        df['Volume (ML)'] = pd.to_numeric(df['Volume (ML)'], errors='coerce').fillna(0).astype('int64')
+    if 'Precos' in df.columns:
+        df['Precos'] = pd.to_numeric(df['Precos'], errors='coerce').fillna(0).astype('float64')
+        df['Precos'] = df['Precos'].replace([np.inf, -np.inf], np.nan)
+    if 'Parcela' in df.columns:
+        df['Parcela'] = pd.to_numeric(df['Parcela'], errors='coerce').fillna(0).astype('int64')
+    for coluna in ('Preco por Litro', 'Valor Parcela'):
+        if coluna in df.columns:
+            df[coluna] = pd.to_numeric(df[coluna], errors='coerce').astype('float64')
+    return df
+
+
+class EscritorTratados:
+    """
+    Grava a base tratada em blocos, sem manter tudo em memória: o CSV no formato original
+    e o Feather sem compressão (para a leitura mapear o arquivo direto na memória).
+    Os blocos vão para arquivos temporários; só ao final, sem erro, eles substituem os
+    arquivos publicados com os.replace e um novo token de versão é gravado. Quem estiver
+    lendo a base antiga nunca vê um arquivo pela metade.
+    O token também vai nos metadados do Feather, já que entre a troca dos arquivos e a
+    gravação do token um leitor pode ver o token antigo com a base nova.
+    """
+
+    def __init__(self, caminho_csv):
+        self.caminho_csv = caminho_csv
+        self._csv = None
+        self._arrow = None
+        self._escritor = None
+        self._cabecalho = True
+
+    def __enter__(self):
+        self._destinos = [self.caminho_csv, caminho_colunar(self.caminho_csv)]
+        self._temporarios = [_temporario(destino) for destino in self._destinos]
+        self._csv = open(self._temporarios[0], 'w', newline='', encoding='UTF-8')
+        self._arrow = pa.OSFile(self._temporarios[1], 'wb')
+        self.versao = novo_token()
+        esquema = ESQUEMA_TRATADOS.with_metadata({'versao': self.versao})
+        self._escritor = pa.ipc.new_file(self._arrow, esquema)
+        return self
+
+    def escrever(self, df):
+        df = tipar_tratados(df)
+        df.to_csv(self._csv, sep=';', index=True, header=self._cabecalho)
+        self._cabecalho = False
+        tabela = pa.Table.from_pandas(df[COLUNAS_TRATADOS], schema=ESQUEMA_TRATADOS, preserve_index=False)
+        self._escritor.write_table(tabela.replace_schema_metadata({'versao': self.versao}))
+
+    def __exit__(self, tipo_erro, *exc):
+        self._escritor.close()
+        self._arrow.close()
+        self._csv.close()
+        if tipo_erro is not None:
+            for temporario in self._temporarios:
+                if os.path.exists(temporario):
+                    os.remove(temporario)
+            return
+        # O Feather (lido pelo app) é trocado por último, logo antes do novo token
+        for temporario, destino in zip(self._temporarios, self._destinos):
+            os.replace(temporario, destino)
+        publicar_versao(self.caminho_csv, self.versao)
+
+
+def salvar_tratados(df, caminho_csv):
+    """Grava a base tratada em CSV (formato original) e em Feather, com o esquema fixo, e publica a versão."""
+    with EscritorTratados(caminho_csv) as escritor:
+        escritor.escrever(df)
+    return escritor.versao
+
+
+def _checar_faixa_float(nome, coluna, tipo):
+    finitos = pc.filter(coluna, pc.is_finite(coluna))
+    maior = pc.max(pc.abs(finitos)).as_py()
+    limite = float(np.finfo(tipo.to_pandas_dtype()).max)
+    if maior is not None and maior > limite:
+        raise pa.ArrowInvalid(f"Coluna '{nome}': {maior} não cabe em {tipo}")
+
+
+def compactar_tabela(tabela):
+    """
+    Converte a tabela Arrow para os tipos compactos antes de virar DataFrame: Produto vira
+    categoria (cada nome distinto guardado uma vez), parcelas int16 e valores float32.
+    Um valor que não cabe no tipo menor gera pa.ArrowInvalid em vez de corromper: o cast dos
+    inteiros já é checado pelo Arrow, e o dos floats (que viraria inf em silêncio) é checado
+    aqui pelo maior valor absoluto finito da coluna.
+    """
+    colunas = []
+    for campo in tabela.schema:
+        coluna = tabela.column(campo.name)
+        tipo = TIPOS_COMPACTOS.get(campo.name)
+        if tipo is not None and pa.types.is_dictionary(tipo):
+            coluna = coluna.dictionary_encode()
+        elif tipo is not None:
+            if pa.types.is_floating(tipo) and pa.types.is_floating(coluna.type):
+                _checar_faixa_float(campo.name, coluna, tipo)
+            coluna = coluna.cast(tipo)
+        colunas.append(coluna)
+    return pa.table(colunas, names=tabela.column_names)
+
+
+def carregar_tratados(caminho_csv, colunas=None, compacto=False):
+    """
+    Carrega a base tratada. Usa o arquivo Feather mapeado em memória quando existe,
+    lendo só as colunas pedidas; sem ele, lê o CSV e converte os tipos.
+    Com `compacto=True`, devolve as colunas nos tipos de TIPOS_COMPACTOS.
+    O token gravado dentro do Feather, quando existe, fica em `df.attrs['versao']`.
+    """
+    arquivo_colunar = caminho_colunar(caminho_csv)
+    versao = None
+    if os.path.exists(arquivo_colunar):
+        tabela = feather.read_table(arquivo_colunar, columns=colunas, memory_map=True)
+        versao = (tabela.schema.metadata or {}).get(b'versao')
+    else:
+        df = pd.read_csv(caminho_csv, sep=';', encoding='UTF-8', index_col=0)
+        df = tipar_tratados(df)
+        if 'Preco por Litro' not in df.columns:
+            df = calcular_metricas(df)
+        df = df[colunas] if colunas is not None else df[[c for c in COLUNAS_TRATADOS if c in df.columns]]
+        tabela = pa.Table.from_pandas(df, preserve_index=False)
+
+    if compacto:
+        tabela = compactar_tabela(tabela)
+    df = tabela.to_pandas()
+    if versao is not None:
+        df.attrs['versao'] = versao.decode('UTF-8')
+    return df
@@ -0,0 +1,203 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from dados import caminho_colunar, ler_versao
+
+MAX_BINS = 100
+MAX_OUTLIERS_GRAFICO = 2000
+
+
+def versao_dataset(caminho_csv):
+    """
+    Versão da base tratada: o token publicado junto com a base ou, sem ele, o mtime e o
+    tamanho do arquivo que será lido. Muda sempre que a base é regravada, sem ler o conteúdo.
+    """
+    token = ler_versao(caminho_csv)
+    if token is not None:
+        return token
+    arquivo = caminho_colunar(caminho_csv)
+    if not os.path.exists(arquivo):
+        arquivo = caminho_csv
+    try:
+        info = os.stat(arquivo)
+    except FileNotFoundError:
+        return 'ausente'
+    return f'{info.st_mtime_ns}-{info.st_size}'
+
+
+def eh_numerica(serie):
+    return pd.api.types.is_numeric_dtype(serie)
+
+
+def eh_categorica(serie):
+    return (pd.api.types.is_object_dtype(serie) or pd.api.types.is_string_dtype(serie)
+            or isinstance(serie.dtype, pd.CategoricalDtype))
+
+
+def _histograma(valores):
+    """Contagens e bordas dos bins calculadas no servidor, com no máximo MAX_BINS bins."""
+    if len(valores) == 0:
+        return np.array([]), np.array([])
+    bins = min(len(np.histogram_bin_edges(valores, bins='auto')) - 1, MAX_BINS)
+    return np.histogram(valores, bins=max(bins, 1))
+
+
+def resumo_numerico(serie):
+    """
+    Medidas resumo, assimetria, quartis e outliers (regra do 1.5 * IQR) de uma coluna numérica,
+    além do histograma e das hastes do boxplot já calculados para os gráficos.
+    """
+    # Colunas compactadas em float32 são somadas em float64 para não perder precisão
+    if pd.api.types.is_float_dtype(serie) and serie.dtype.itemsize < 8:
+        serie = serie.astype('float64')
+    q1 = serie.quantile(0.25)
+    q3 = serie.quantile(0.75)
+    iqr = q3 - q1
+    limite_inferior = q1 - 1.5 * iqr
+    limite_superior = q3 + 1.5 * iqr
+
+    valores = serie.dropna().to_numpy()
+    mascara_outliers = (valores > limite_superior) | (valores < limite_inferior)
+    dentro = valores[~mascara_outliers]
+    valores_outliers = valores[mascara_outliers]
+    if len(valores_outliers) > MAX_OUTLIERS_GRAFICO:
+        valores_outliers = np.random.default_rng(0).choice(valores_outliers, MAX_OUTLIERS_GRAFICO, replace=False)
+    contagens, bordas = _histograma(valores)
+
+    return {
+        'tipo': 'numerica',
+        'validos': int(serie.notna().sum()),
+        'distintos': int(serie.nunique(dropna=True)),
+        'media': serie.mean(skipna=True),
+        'desvio': serie.std(skipna=True),
+        'mediana': serie.median(skipna=True),
+        'minimo': serie.min(skipna=True),
+        'maximo': serie.max(skipna=True),
+        'assimetria': serie.skew(),
+        'q1': q1,
+        'q3': q3,
+        'iqr': iqr,
+        'limite_inferior': limite_inferior,
+        'limite_superior': limite_superior,
+        'outliers': int(mascara_outliers.sum()),
+        'haste_inferior': dentro.min() if len(dentro) else q1,
+        'haste_superior': dentro.max() if len(dentro) else q3,
+        'valores_outliers': valores_outliers,
+        'histograma': (contagens, bordas),
+    }
+
+
+def resumo_categorico(serie):
+    """Medidas resumo e contagem de cada categoria de uma coluna de texto."""
+    contagem = serie.value_counts()
+    # Em colunas categóricas, categorias sem nenhuma linha (ex.: após um filtro) não entram
+    contagem = contagem[contagem > 0].reset_index()
+    contagem.columns = [serie.name, 'Contagem']
+    return {
+        'tipo': 'categorica',
+        'validos': int(serie.notna().sum()),
+        'descricao': serie.describe(),
+        'contagem': contagem,
+    }
+
+
+def resumo_dataset(df):
+    """
+    Calcula de uma vez tudo o que as análises univariadas mostram, para todas as colunas.
+    O resultado é guardado por versão da base, então as interações do dashboard só consultam.
+    """
+    nulos = df.isnull().sum()
+    aux_nulos = nulos.reset_index()
+    aux_nulos.columns = ['Variável', 'Quantidade de Nulos']
+
+    try:
+        descricao, erro_descricao = df.describe(include='all'), None
+    except Exception as e:
+        descricao, erro_descricao = None, str(e)
+
+    colunas = {}
+    for coluna in df.columns:
+        if df[coluna].notna().sum() == 0:
+            colunas[coluna] = {'tipo': 'vazia', 'validos': 0}
+        elif eh_numerica(df[coluna]):
+            colunas[coluna] = resumo_numerico(df[coluna])
+        elif eh_categorica(df[coluna]):
+            colunas[coluna] = resumo_categorico(df[coluna])
+        else:
+            colunas[coluna] = {'tipo': 'outra', 'validos': int(df[coluna].notna().sum())}
+
+    return {
+        'linhas': len(df),
+        'nulos': aux_nulos,
+        'descricao': descricao,
+        'erro_descricao': erro_descricao,
+        'colunas_validas': [coluna for coluna in df.columns if nulos[coluna] < len(df)],
+        'colunas': colunas,
+    }
+
+
+def quartis_por_grupo(df, coluna_categoria, colunas_numericas):
+    """
+    Quartis, mínimo, máximo e contagem de cada coluna numérica por categoria, em um único groupby.
+    Retorna um dicionário coluna numérica -> tabela com uma linha por categoria.
+    """
+    grupos = df.groupby(coluna_categoria, observed=True, sort=False)[colunas_numericas]
+    quantis = grupos.quantile([0.25, 0.5, 0.75])
+    minimos = grupos.min()
+    maximos = grupos.max()
+    contagens = grupos.count()
+
+    tabelas = {}
+    for coluna in colunas_numericas:
+        por_quantil = quantis[coluna].unstack()
+        tabelas[coluna] = pd.DataFrame({
+            'contagem': contagens[coluna],
+            'minimo': minimos[coluna],
+            'q1': por_quantil[0.25],
+            'mediana': por_quantil[0.5],
+            'q3': por_quantil[0.75],
+            'maximo': maximos[coluna],
+        })
+    return tabelas
+
+
+def resumo_bivariado(df):
+    """
+    Calcula de uma vez as estatísticas de todos os pares de colunas usados na análise bivariada:
+    a matriz de correlação de Pearson entre as numéricas, os quartis de cada numérica por
+    categoria e as tabelas de contingência entre pares de categóricas.
+    """
+    numericas = [coluna for coluna in df.columns if eh_numerica(df[coluna]) and df[coluna].notna().any()]
+    categoricas = [coluna for coluna in df.columns if eh_categorica(df[coluna]) and df[coluna].notna().any()]
+
+    correlacoes = df[numericas].corr(method='pearson') if numericas else pd.DataFrame()
+
+    grupos = {}
+    for categoria in categoricas:
+        if numericas:
+            for numerica, tabela in quartis_por_grupo(df, categoria, numericas).items():
+                grupos[(categoria, numerica)] = tabela
+
+    contingencias = {}
+    for i, coluna_a in enumerate(categoricas):
+        for coluna_b in categoricas[i + 1:]:
+            contingencias[(coluna_a, coluna_b)] = pd.crosstab(df[coluna_a], df[coluna_b])
+
+    return {
+        'numericas': numericas,
+        'categoricas': categoricas,
+        'correlacoes': correlacoes,
+        'grupos': grupos,
+        'contingencias': contingencias,
+    }
+
+
+def contingencia(bivariado, coluna_x, coluna_y):
+    """Tabela de contingência já calculada, na orientação pedida (linhas = coluna_x)."""
+    if (coluna_x, coluna_y) in bivariado['contingencias']:
+        return bivariado['contingencias'][(coluna_x, coluna_y)]
+    return bivariado['contingencias'][(coluna_y, coluna_x)].T
@@ -0,0 +1,105 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import re
+
+import pandas as pd
+from lxml import html as lxml_html
+
+from instrumentacao import RelatorioExecucao
+
+# No HTML renderizado pelo navegador a listagem aparece em div[14] ou div[15], dependendo
+# dos modais e banners que os scripts inserem antes dela
+XPATH_CARDS = '/html/body/div[{posicao}]/section/article[2]/div[1]/div/div'
+POSICOES_LISTAGEM = (14, 15)
+
+# No HTML entregue pelo servidor (sem JavaScript) essas divs não existem e as posições mudam,
+# então os cards são localizados pela própria estrutura: a listagem da seção e os blocos
+# que têm a área de detalhes (div[2]/div[4]) de um produto
+XPATH_CARDS_ESTRUTURAL = '//section/article[2]/div[1]/div/div[div[2]/div[4]]'
+
+# Caminhos relativos a cada card de produto
+XPATH_CAMPOS = {
+    'Produto': 'div[2]/div[4]/a/h2',
+    'Volume (ML)': 'div[2]/div[2]/p',
+    'Precos': 'div[2]/div[4]/a/p[4]',
+    'Parcela': 'div[2]/div[4]/p/b[1]',
+}
+
+COLUNAS = list(XPATH_CAMPOS)
+
+
+def _texto(card, xpath):
+    """Retorna o texto visível do primeiro elemento encontrado, ou None."""
+    elementos = card.xpath(xpath)
+    if not elementos:
+        return None
+    texto = ' '.join(elementos[0].text_content().split())
+    return texto or None
+
+
+def _primeiro_numero(texto):
+    if texto is None:
+        return None
+    numeros = re.findall(r'\d+', texto)
+    return int(numeros[0]) if numeros else None
+
+
+def extrair_card(card):
+    """Lê nome, volume, preço e parcelas de um card de produto."""
+    preco = _primeiro_numero(_texto(card, XPATH_CAMPOS['Precos']))
+    return {
+        'Produto': _texto(card, XPATH_CAMPOS['Produto']),
+        'Volume (ML)': _primeiro_numero(_texto(card, XPATH_CAMPOS['Volume (ML)'])),
+        'Precos': float(preco) if preco is not None else None,
+        'Parcela': _primeiro_numero(_texto(card, XPATH_CAMPOS['Parcela'])),
+    }
+
+
+def extrair_produtos(pagina_html, limite=None, relatorio=None, estrutural=False):
+    """
+    Extrai todos os cards de produto da página em uma única passada.
+    Cada card gera um registro com os quatro campos, então um campo ausente vira None
+    na própria linha em vez de desalinhar as colunas.
+    Por padrão usa as posições da página renderizada pelo navegador; com `estrutural=True`
+    (HTML baixado direto do servidor) localiza os cards pela estrutura da listagem.
+    O relatório recebe quantos cards vieram de cada listagem e quantos valores
+    de cada campo foram encontrados ou ficaram ausentes.
+    """
+    relatorio = relatorio or RelatorioExecucao()
+    if not pagina_html or not pagina_html.strip():
+        # Resposta sem corpo (o lxml recusaria o documento vazio): nenhum card
+        relatorio.contar('paginas', 'vazias')
+        relatorio.contar('cards', 'extraidos', 0)
+        return []
+    arvore = lxml_html.fromstring(pagina_html)
+    cards = []
+    if estrutural:
+        cards = arvore.xpath(XPATH_CARDS_ESTRUTURAL)
+        relatorio.contar('cards_por_listagem', 'estrutural', len(cards))
+    else:
+        for posicao in POSICOES_LISTAGEM:
+            encontrados = arvore.xpath(XPATH_CARDS.format(posicao=posicao))
+            relatorio.contar('cards_por_listagem', f'div[{posicao}]', len(encontrados))
+            cards.extend(encontrados)
+    if limite is not None:
+        cards = cards[:limite]
+
+    registros = []
+    for card in cards:
+        registro = extrair_card(card)
+        if any(valor is not None for valor in registro.values()):
+            registros.append(registro)
+            for campo, valor in registro.items():
+                relatorio.contar(f'campo_{campo}', 'ausente' if valor is None else 'encontrado')
+        else:
+            relatorio.contar('cards', 'vazios')
+    relatorio.contar('cards', 'extraidos', len(registros))
+    return registros
+
+
+def montar_tabela(registros):
+    """Monta o DataFrame no formato Produto / Volume (ML) / Precos / Parcela."""
+    tabela = pd.DataFrame(registros, columns=COLUNAS)
+    tabela['Volume (ML)'] = tabela['Volume (ML)'].astype('Int64')
+    tabela['Parcela'] = tabela['Parcela'].astype('Int64')
+    return tabela
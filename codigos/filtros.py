@@ -0,0 +1,86 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import numpy as np
+import pandas as pd
+
+COLUNAS_FILTRO = ['Precos', 'Volume (ML)', 'Parcela', 'Preco por Litro']
+
+
+def _dobrar(textos):
+    """Minúsculas e sem acentos, para a busca por nome ignorar essas diferenças."""
+    return (textos.astype(str).str.normalize('NFKD').str.encode('ascii', 'ignore')
+            .str.decode('ascii').str.lower())
+
+
+class IndiceFiltros:
+    """
+    Índices montados uma vez por versão da base para responder aos filtros sem varrer o DataFrame:
+    cada coluna numérica guarda suas posições em ordem crescente (intervalos viram dois
+    searchsorted) e os nomes ficam codificados, de modo que a busca textual só percorre
+    os nomes distintos e a máscara final sai de uma indexação do vetor de códigos.
+    """
+
+    def __init__(self, df, colunas=COLUNAS_FILTRO, coluna_nome='Produto'):
+        self.linhas = len(df)
+        self._ordem = {}
+        self._ordenados = {}
+        for coluna in colunas:
+            if coluna in df.columns:
+                # Colunas já compactadas (até 4 bytes) mantêm índices em float32/int32
+                tipo = 'float32' if df[coluna].dtype.itemsize <= 4 else 'float64'
+                valores = df[coluna].to_numpy(dtype=tipo, na_value=np.nan)
+                ordem = np.argsort(valores, kind='stable')
+                if self.linhas < 2 ** 31:
+                    ordem = ordem.astype(np.int32)
+                self._ordem[coluna] = ordem
+                self._ordenados[coluna] = valores[ordem]
+
+        self._codigos = None
+        if coluna_nome in df.columns:
+            self._codigos, nomes = pd.factorize(df[coluna_nome])
+            self._nomes = _dobrar(pd.Series(nomes))
+
+    @property
+    def colunas(self):
+        return list(self._ordenados)
+
+    def limites(self, coluna):
+        """Menor e maior valor não nulo da coluna."""
+        ordenados = self._ordenados[coluna]
+        validos = ordenados[~np.isnan(ordenados)]
+        if len(validos) == 0:
+            return None
+        return float(validos[0]), float(validos[-1])
+
+    def mascara_intervalo(self, coluna, minimo, maximo):
+        ordenados = self._ordenados[coluna]
+        # Limites no tipo do índice: em float64, o float32 de 199.99 ficaria acima de 199.99
+        # e a linha sairia do intervalo, ao contrário da comparação direta com a coluna
+        minimo, maximo = ordenados.dtype.type(minimo), ordenados.dtype.type(maximo)
+        inicio = np.searchsorted(ordenados, minimo, side='left')
+        fim = np.searchsorted(ordenados, maximo, side='right')
+        mascara = np.zeros(self.linhas, dtype=bool)
+        mascara[self._ordem[coluna][inicio:fim]] = True
+        return mascara
+
+    def mascara_nome(self, termo):
+        if self._codigos is None:
+            return np.ones(self.linhas, dtype=bool)
+        termo = _dobrar(pd.Series([termo])).iloc[0].strip()
+        encontrados = self._nomes.str.contains(termo, regex=False).to_numpy(dtype=bool)
+        # Código -1 (nome nulo) cai na posição extra, que fica sempre False
+        return np.append(encontrados, False)[self._codigos]
+
+    def mascara(self, filtros):
+        """
+        Combina os filtros ativos. `filtros` é uma tupla de (coluna, mínimo, máximo)
+        e/ou ('nome', termo), como a montada pela barra lateral do app.
+        """
+        mascara = np.ones(self.linhas, dtype=bool)
+        for filtro in filtros:
+            if filtro[0] == 'nome':
+                mascara &= self.mascara_nome(filtro[1])
+            else:
+                coluna, minimo, maximo = filtro
+                mascara &= self.mascara_intervalo(coluna, minimo, maximo)
+        return mascara
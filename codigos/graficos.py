@@ -0,0 +1,105 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import numpy as np
+import plotly.graph_objects as go
+
+# Acima disso a dispersão vira um mapa de densidade calculado no servidor
+MAX_PONTOS_DISPERSAO = 20_000
+BINS_DENSIDADE = 100
+MAX_CATEGORIAS_BARRAS = 50
+LINHAS_POR_PAGINA = 100
+
+
+def histograma(resumo, coluna):
+    """Histograma a partir das contagens já calculadas: só os bins vão para o navegador."""
+    contagens, bordas = resumo['histograma']
+    centros = (bordas[:-1] + bordas[1:]) / 2
+    larguras = np.diff(bordas)
+    fig = go.Figure(go.Bar(x=centros, y=contagens, width=larguras, name=coluna))
+    fig.update_layout(title=f'Distribuição de {coluna}', xaxis_title=coluna, yaxis_title='count', bargap=0)
+    return fig
+
+
+def boxplot(resumo, coluna):
+    """Boxplot montado com quartis e hastes pré-calculados; só os outliers são enviados como pontos."""
+    fig = go.Figure()
+    fig.add_trace(go.Box(
+        name=coluna,
+        q1=[resumo['q1']], median=[resumo['mediana']], q3=[resumo['q3']],
+        lowerfence=[resumo['haste_inferior']], upperfence=[resumo['haste_superior']],
+        boxpoints=False,
+    ))
+    if len(resumo['valores_outliers']):
+        fig.add_trace(go.Scattergl(
+            x=[coluna] * len(resumo['valores_outliers']), y=resumo['valores_outliers'],
+            mode='markers', name='outliers', showlegend=False,
+        ))
+    fig.update_layout(title=f'Boxplot de {coluna}', yaxis_title=coluna)
+    return fig
+
+
+def dispersao(df, coluna_x, coluna_y, max_pontos=MAX_PONTOS_DISPERSAO):
+    """
+    Dispersão em WebGL. Com muitos pontos, os pares são agrupados em uma grade no servidor
+    e o navegador recebe apenas o mapa de densidade.
+    """
+    pares = df[[coluna_x, coluna_y]].dropna()
+    titulo = f'Dispersão entre {coluna_x} e {coluna_y}'
+    if len(pares) <= max_pontos:
+        fig = go.Figure(go.Scattergl(x=pares[coluna_x], y=pares[coluna_y], mode='markers'))
+    else:
+        contagens, bordas_x, bordas_y = np.histogram2d(pares[coluna_x], pares[coluna_y], bins=BINS_DENSIDADE)
+        contagens = np.where(contagens > 0, contagens, np.nan)
+        fig = go.Figure(go.Heatmap(
+            x=(bordas_x[:-1] + bordas_x[1:]) / 2, y=(bordas_y[:-1] + bordas_y[1:]) / 2,
+            z=contagens.T, colorscale='Viridis', colorbar=dict(title='Contagem'),
+        ))
+        titulo += f' (densidade de {len(pares)} pontos)'
+    fig.update_layout(title=titulo, xaxis_title=coluna_x, yaxis_title=coluna_y)
+    return fig
+
+
+def barras_categorias(contagem, coluna, max_categorias=MAX_CATEGORIAS_BARRAS):
+    """Barras das categorias mais frequentes (a contagem já vem ordenada)."""
+    exibidas = contagem.head(max_categorias)
+    titulo = f'Contagem de Categorias em {coluna}'
+    if len(contagem) > max_categorias:
+        titulo += f' ({max_categorias} mais frequentes de {len(contagem)})'
+    fig = go.Figure(go.Bar(x=exibidas[coluna], y=exibidas['Contagem']))
+    fig.update_layout(title=titulo, xaxis_title=coluna, yaxis_title='Contagem')
+    return fig
+
+
+def pagina(df, numero, linhas_por_pagina=LINHAS_POR_PAGINA):
+    """Fatia de uma página da tabela (numeradas a partir de 1)."""
+    inicio = (numero - 1) * linhas_por_pagina
+    return df.iloc[inicio:inicio + linhas_por_pagina]
+
+
+def boxplot_grupos(quartis, coluna_categoria, coluna_numerica, max_categorias=MAX_CATEGORIAS_BARRAS):
+    """
+    Boxplot por categoria a partir da tabela de quartis pré-calculada (uma linha por categoria).
+    Com muitas categorias, mostra apenas as mais frequentes. As hastes vão do mínimo ao máximo.
+    """
+    exibidas = quartis.sort_values('contagem', ascending=False).head(max_categorias)
+    titulo = f'Boxplot de {coluna_numerica} por {coluna_categoria}'
+    if len(quartis) > max_categorias:
+        titulo += f' ({max_categorias} categorias mais frequentes de {len(quartis)})'
+    fig = go.Figure(go.Box(
+        x=exibidas.index.astype(str),
+        q1=exibidas['q1'], median=exibidas['mediana'], q3=exibidas['q3'],
+        lowerfence=exibidas['minimo'], upperfence=exibidas['maximo'],
+        boxpoints=False,
+    ))
+    fig.update_layout(title=titulo, xaxis_title=coluna_categoria, yaxis_title=coluna_numerica)
+    return fig
+
+
+def mapa_correlacoes(correlacoes):
+    """Mapa de calor da matriz de correlação de Pearson."""
+    fig = go.Figure(go.Heatmap(
+        x=correlacoes.columns, y=correlacoes.index, z=correlacoes.to_numpy(),
+        zmin=-1, zmax=1, colorscale='RdBu', text=correlacoes.round(2).to_numpy(), texttemplate='%{text}',
+    ))
+    fig.update_layout(title='Matriz de Correlação (Pearson)')
+    return fig
@@ -0,0 +1,172 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import argparse
+import os
+import uuid
+from datetime import date, datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from identidade import id_estavel, normalizar_produto
+
+RAIZ_HISTORICO = '../bases_historicas'
+# O prefixo "_" faz a leitura do dataset ignorar o arquivo
+CAMINHO_IDENTIDADES = os.path.join(RAIZ_HISTORICO, '_identidades.json')
+# Presente quando todas as partições já usam os ids do resolvedor de identidade
+MARCADOR_IDS = '_ids_resolvedor'
+
+ESQUEMA_HISTORICO = pa.schema([
+    ('id_produto', pa.string()),
+    ('coletado_em', pa.timestamp('us')),
+    ('Produto', pa.string()),
+    ('Volume (ML)', pa.int64()),
+    ('Precos', pa.float64()),
+    ('Parcela', pa.int64()),
+])
+
+
+def id_produto(nome, volume):
+    """Identificador estável do produto: hash do nome canônico com o volume."""
+    return id_estavel(normalizar_produto(nome), volume)
+
+
+def _particao(raiz, data):
+    return os.path.join(raiz, f'data_coleta={data}')
+
+
+def _gravar(tabela, caminho, **opcoes):
+    # Grava com prefixo "." (ignorado pelas leituras) e renomeia de forma atômica
+    temporario = os.path.join(os.path.dirname(caminho), '.' + os.path.basename(caminho))
+    pq.write_table(tabela, temporario, **opcoes)
+    os.replace(temporario, caminho)
+
+
+def _tabela(df):
+    return pa.Table.from_pandas(df[ESQUEMA_HISTORICO.names], schema=ESQUEMA_HISTORICO, preserve_index=False)
+
+
+def anexar_coleta(df, raiz=RAIZ_HISTORICO, instante=None, resolvedor=None):
+    """
+    Grava a coleta como um novo arquivo na partição do dia, sem ler nem reescrever o histórico.
+    O custo depende apenas do número de linhas desta coleta. Com um `resolvedor`
+    (identidade.ResolvedorIdentidade), variações do mesmo nome recebem o mesmo id.
+    """
+    instante = instante or datetime.now()
+    coleta = df.copy()
+    if resolvedor is not None:
+        coleta['id_produto'] = resolvedor.resolver_tabela(coleta)
+    else:
+        coleta['id_produto'] = [id_produto(n, v) for n, v in zip(coleta['Produto'], coleta['Volume (ML)'])]
+    coleta['coletado_em'] = pd.Timestamp(instante)
+
+    pasta = _particao(raiz, instante.strftime('%Y-%m-%d'))
+    os.makedirs(pasta, exist_ok=True)
+    caminho = os.path.join(pasta, f'parte-{instante:%H%M%S%f}-{uuid.uuid4().hex[:8]}.parquet')
+    _gravar(_tabela(coleta), caminho)
+    return caminho
+
+
+def _datas(raiz):
+    if not os.path.isdir(raiz):
+        return []
+    return sorted(nome.split('=', 1)[1] for nome in os.listdir(raiz) if nome.startswith('data_coleta='))
+
+
+def compactar(raiz=RAIZ_HISTORICO, datas=None, antes_de=None):
+    """
+    Junta os arquivos de cada partição em um só, ordenado por produto e instante.
+    A ordenação permite que a leitura do histórico de um produto pule row groups inteiros.
+    Sem `datas`, percorre todas as partições anteriores a `antes_de` ('AAAA-MM-DD'; todas,
+    se None). Retorna quantas partições foram compactadas.
+    """
+    if datas is None:
+        datas = [data for data in _datas(raiz) if antes_de is None or data < antes_de]
+    compactadas = 0
+    for data in datas:
+        pasta = _particao(raiz, data)
+        partes = sorted(os.path.join(pasta, nome) for nome in os.listdir(pasta)
+                        if nome.endswith('.parquet') and not nome.startswith('.'))
+        if len(partes) < 2:
+            continue
+        tabela = pa.concat_tables(pq.read_table(parte, schema=ESQUEMA_HISTORICO) for parte in partes)
+        tabela = tabela.sort_by([('id_produto', 'ascending'), ('coletado_em', 'ascending')])
+        destino = os.path.join(pasta, f'compactado-{uuid.uuid4().hex[:8]}.parquet')
+        _gravar(tabela, destino, row_group_size=64 * 1024)
+        for parte in partes:
+            os.remove(parte)
+        compactadas += 1
+    return compactadas
+
+
+def migrar_ids(raiz=RAIZ_HISTORICO, resolvedor=None):
+    """
+    Regrava, uma única vez, o id_produto das partições gravadas antes do resolvedor de identidade,
+    cujos ids eram o hash do nome só em minúsculas com o volume ('' se nulo). Sem isso,
+    historico_produto não encontraria as coletas antigas pelos ids atuais. Depois de migrar,
+    grava MARCADOR_IDS na raiz e as próximas chamadas não fazem nada.
+    Retorna quantos arquivos foram regravados.
+    """
+    marcador = os.path.join(raiz, MARCADOR_IDS)
+    if os.path.exists(marcador):
+        return 0
+    regravados = 0
+    for data in _datas(raiz):
+        pasta = _particao(raiz, data)
+        for nome in sorted(os.listdir(pasta)):
+            if not nome.endswith('.parquet') or nome.startswith('.'):
+                continue
+            caminho = os.path.join(pasta, nome)
+            df = pq.read_table(caminho, schema=ESQUEMA_HISTORICO).to_pandas()
+            if resolvedor is not None:
+                df['id_produto'] = resolvedor.resolver_tabela(df)
+            else:
+                df['id_produto'] = [id_produto(n, v) for n, v in zip(df['Produto'], df['Volume (ML)'])]
+            tabela = _tabela(df).sort_by([('id_produto', 'ascending'), ('coletado_em', 'ascending')])
+            _gravar(tabela, caminho, row_group_size=64 * 1024)
+            regravados += 1
+    os.makedirs(raiz, exist_ok=True)
+    with open(marcador, 'w', encoding='UTF-8') as arquivo:
+        arquivo.write(datetime.now().isoformat(timespec='seconds'))
+    return regravados
+
+
+def _dataset(raiz):
+    return ds.dataset(raiz, format='parquet', partitioning='hive', schema=ESQUEMA_HISTORICO)
+
+
+def ultima_coleta(raiz=RAIZ_HISTORICO):
+    """Retorna apenas as linhas da coleta mais recente, lendo somente a partição do último dia."""
+    datas = _datas(raiz)
+    if not datas:
+        return pd.DataFrame(columns=ESQUEMA_HISTORICO.names)
+    pasta = _particao(raiz, datas[-1])
+    df = ds.dataset(pasta, format='parquet', schema=ESQUEMA_HISTORICO).to_table().to_pandas()
+    return df[df['coletado_em'] == df['coletado_em'].max()].reset_index(drop=True)
+
+
+def historico_produto(id_busca, raiz=RAIZ_HISTORICO, colunas=('coletado_em', 'Produto', 'Precos', 'Parcela')):
+    """Série de preços de um produto ao longo das coletas."""
+    if not _datas(raiz):
+        return pd.DataFrame(columns=list(colunas))
+    tabela = _dataset(raiz).to_table(columns=list(colunas), filter=ds.field('id_produto') == id_busca)
+    return tabela.to_pandas().sort_values('coletado_em').reset_index(drop=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Manutenção do histórico de preços.')
+    parser.add_argument('--compactar', action='store_true',
+                        help='junta os arquivos de cada partição diária em um só')
+    parser.add_argument('--datas', nargs='+', default=None,
+                        help='partições a compactar (AAAA-MM-DD); por padrão, todas antes de hoje')
+    parser.add_argument('--raiz', default=RAIZ_HISTORICO)
+    args = parser.parse_args()
+
+    if args.compactar:
+        # A partição de hoje ainda recebe coletas; fica para a compactação do dia seguinte
+        total = compactar(args.raiz, datas=args.datas, antes_de=date.today().isoformat())
+        print(f"{total} partição(ões) compactada(s) em {args.raiz}.")
+    else:
+        parser.print_help()
@@ -0,0 +1,210 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import hashlib
+import json
+import math
+import os
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+
+import pandas as pd
+
+LIMIAR_SIMILARIDADE = 0.8
+# Em um catálogo grande até os trigramas mais raros de um nome podem aparecer em milhares de
+# produtos; de cada postagem só são lidos os produtos mais recentes
+MAX_POSTAGEM = 200
+MAX_CANDIDATOS = 20
+
+_SAFRA = re.compile(r'\b(19|20)\d{2}\b')
+_NAO_ALFANUMERICO = re.compile(r'[^a-z0-9]+')
+
+
+def normalizar_produto(nome):
+    """
+    Forma canônica do nome: sem acentos, minúsculo, sem safra, sem pontuação
+    e com espaços simples. "Château Marjosse Rouge 2022" -> "chateau marjosse rouge".
+    """
+    if nome is None or (isinstance(nome, float) and pd.isna(nome)):
+        return ''
+    texto = unicodedata.normalize('NFKD', str(nome))
+    texto = ''.join(c for c in texto if not unicodedata.combining(c)).lower()
+    texto = _SAFRA.sub(' ', texto)
+    texto = _NAO_ALFANUMERICO.sub(' ', texto)
+    return ' '.join(texto.split())
+
+
+def _volume(volume):
+    return 0 if volume is None or pd.isna(volume) else int(volume)
+
+
+def trigramas(texto):
+    texto = f'  {texto} '
+    return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+
+
+def id_estavel(nome_normalizado, volume):
+    chave = f'{nome_normalizado}|{_volume(volume)}'
+    return hashlib.sha1(chave.encode('UTF-8')).hexdigest()[:16]
+
+
+class ResolvedorIdentidade:
+    """
+    Atribui um id estável de produto a cada (nome, volume) coletado.
+    Nomes com a mesma forma canônica são resolvidos por um dicionário; os demais passam
+    por um índice invertido de trigramas (blocking) que devolve poucos candidatos do mesmo
+    volume, comparados pela similaridade de Jaccard. Sem candidato acima do limiar, o nome
+    vira um produto novo. Só as postagens dos trigramas mais raros do nome são percorridas
+    (prefix filtering), cada uma limitada a MAX_POSTAGEM produtos, e os nomes cortados são
+    procurados por busca binária em uma lista ordenada de nomes, então o custo por linha
+    praticamente não cresce com o tamanho do catálogo.
+    """
+
+    def __init__(self, limiar=LIMIAR_SIMILARIDADE):
+        self.limiar = limiar
+        self.produtos = {}
+        self._exatos = {}
+        self._trigramas = {}
+        self._indice = {}
+        # volume -> [(nome usado na comparação por prefixo, id)] em ordem
+        self._ordenados = {}
+
+    def __len__(self):
+        return len(self.produtos)
+
+    def _indexar(self, id_produto, nome_normalizado, volume, truncado=False, completo=None):
+        self.produtos[id_produto] = {'nome': nome_normalizado, 'volume': volume, 'truncado': truncado,
+                                     'completo': completo}
+        self._exatos[(nome_normalizado, volume)] = id_produto
+        grams = trigramas(nome_normalizado)
+        self._trigramas[id_produto] = grams
+        for gram in grams:
+            self._indice.setdefault((gram, volume), []).append(id_produto)
+        insort(self._ordenados.setdefault(volume, []), (completo or nome_normalizado, id_produto))
+
+    def _completar(self, id_produto, nome_completo):
+        """Liga o produto cortado ao nome completo, que passa a ser o usado na comparação."""
+        produto = self.produtos[id_produto]
+        ordenados = self._ordenados[produto['volume']]
+        del ordenados[bisect_left(ordenados, (produto['nome'], id_produto))]
+        produto['completo'] = nome_completo
+        insort(ordenados, (nome_completo, id_produto))
+
+    def _por_prefixo(self, nome_normalizado, volume):
+        """Produtos do volume cujo nome começa com `nome_normalizado` ou é o começo dele."""
+        ordenados = self._ordenados.get(volume, [])
+        for tamanho in range(1, len(nome_normalizado) + 1):
+            inicio = nome_normalizado[:tamanho]
+            i = bisect_left(ordenados, (inicio,))
+            while i < len(ordenados) and (ordenados[i][0] == inicio or
+                                          (tamanho == len(nome_normalizado) and ordenados[i][0].startswith(inicio))):
+                yield ordenados[i][1]
+                i += 1
+
+    def _candidatos(self, grams, volume):
+        """
+        Produtos do mesmo volume que podem passar do limiar de Jaccard. Um produto com
+        Jaccard >= limiar tem pelo menos limiar * n dos n trigramas do nome, logo compartilha
+        algum dos n - ceil(limiar * n) + 1 mais raros (prefix filtering); trigramas ausentes
+        do índice contam como os mais raros. Cada postagem é limitada aos MAX_POSTAGEM produtos
+        mais recentes, o que mantém o custo por linha constante.
+        """
+        prefixo = len(grams) - math.ceil(self.limiar * len(grams)) + 1
+        postagens = sorted((self._indice.get((gram, volume), ()) for gram in grams), key=len)
+        contagem = Counter()
+        for postagem in postagens[:prefixo]:
+            contagem.update(postagem[-MAX_POSTAGEM:])
+        return [id_produto for id_produto, _ in contagem.most_common(MAX_CANDIDATOS)]
+
+    def _semelhante(self, nome_normalizado, grams, volume, truncado):
+        """
+        Produto conhecido equivalente ao nome, ou None. Nomes completos casam pela similaridade
+        de Jaccard. Nomes cortados pelo site ("Los Vascos Cromas Gran Reserva Cabe...") só casam
+        pelo prefixo, já que o final que diferenciaria dois vinhos foi perdido, e apenas quando
+        um único produto conhecido é compatível com ele; se houver mais de um, o nome vira um
+        produto próprio em vez de misturar os históricos.
+        """
+        melhor, melhor_nota = None, 0.0
+        por_prefixo = []
+        for candidato in self._por_prefixo(nome_normalizado, volume):
+            produto = self.produtos[candidato]
+            # Um produto cortado que já foi ligado a um nome completo passa a ser comparado por ele
+            if truncado or (produto['truncado'] and not produto['completo']):
+                por_prefixo.append(candidato)
+                if len(por_prefixo) > 1:
+                    break
+        for candidato in self._candidatos(grams, volume):
+            produto = self.produtos[candidato]
+            if truncado or (produto['truncado'] and not produto['completo']):
+                continue
+            outro = produto['completo'] or produto['nome']
+            grams_outro = trigramas(outro) if produto['completo'] else self._trigramas[candidato]
+            nota = len(grams & grams_outro) / len(grams | grams_outro)
+            if nota > melhor_nota:
+                melhor, melhor_nota = candidato, nota
+        if melhor_nota >= self.limiar:
+            return melhor
+        if len(por_prefixo) != 1:
+            return None
+
+        produto = self.produtos[por_prefixo[0]]
+        if not truncado and produto['truncado']:
+            # O nome cortado fica ligado só a este nome completo; outros finais viram produtos novos
+            self._completar(por_prefixo[0], nome_normalizado)
+        return por_prefixo[0]
+
+    def resolver(self, nome, volume):
+        """Id do produto para um nome e volume coletados; registra um produto novo se preciso."""
+        volume = _volume(volume)
+        nome_normalizado = normalizar_produto(nome)
+        existente = self._exatos.get((nome_normalizado, volume))
+        if existente is not None:
+            return existente
+
+        grams = trigramas(nome_normalizado)
+        truncado = str(nome).rstrip().endswith('...')
+        semelhante = self._semelhante(nome_normalizado, grams, volume, truncado)
+        if semelhante is not None:
+            # Variações conhecidas também passam a ser resolvidas direto pelo dicionário
+            self._exatos[(nome_normalizado, volume)] = semelhante
+            return semelhante
+
+        id_produto = id_estavel(nome_normalizado, volume)
+        self._indexar(id_produto, nome_normalizado, volume, truncado)
+        return id_produto
+
+    def resolver_tabela(self, df, coluna_nome='Produto', coluna_volume='Volume (ML)'):
+        """Ids para todas as linhas, resolvendo cada par (nome, volume) distinto uma única vez."""
+        pares = pd.MultiIndex.from_arrays([df[coluna_nome], df[coluna_volume]])
+        codigos, distintos = pd.factorize(pares)
+        ids = [self.resolver(nome, volume) for nome, volume in distintos]
+        return pd.Series([ids[c] if c >= 0 else None for c in codigos], index=df.index, name='id_produto')
+
+    def salvar(self, caminho):
+        estado = {
+            'limiar': self.limiar,
+            'produtos': [[i, p['nome'], p['volume'], p['truncado'], p['completo']] for i, p in self.produtos.items()],
+            'variacoes': [[nome, volume, i] for (nome, volume), i in self._exatos.items()
+                          if self.produtos[i]['nome'] != nome],
+        }
+        os.makedirs(os.path.dirname(caminho) or '.', exist_ok=True)
+        temporario = caminho + '.tmp'
+        with open(temporario, 'w', encoding='UTF-8') as arquivo:
+            json.dump(estado, arquivo, ensure_ascii=False)
+        os.replace(temporario, caminho)
+
+    @classmethod
+    def carregar(cls, caminho, limiar=None):
+        """Recria o resolvedor salvo (ou um vazio, se o arquivo não existe) reconstruindo o índice."""
+        if not os.path.exists(caminho):
+            return cls(limiar or LIMIAR_SIMILARIDADE)
+        with open(caminho, encoding='UTF-8') as arquivo:
+            estado = json.load(arquivo)
+        resolvedor = cls(limiar or estado.get('limiar', LIMIAR_SIMILARIDADE))
+        for id_produto, nome, volume, truncado, *completo in estado['produtos']:
+            resolvedor._indexar(id_produto, nome, volume, truncado, *completo)
+        for nome, volume, id_produto in estado.get('variacoes', []):
+            resolvedor._exatos[(nome, volume)] = id_produto
+        return resolvedor
@@ -0,0 +1,68 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import cProfile
+import json
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class RelatorioExecucao:
+    """
+    Acumula o tempo de cada etapa de uma execução e contadores agrupados
+    (ex.: campos encontrados/ausentes, linhas removidas) para gravar em JSON.
+    """
+
+    def __init__(self):
+        self.inicio = datetime.now()
+        self._relogio = time.perf_counter()
+        self.etapas = {}
+        self.contadores = {}
+        self.informacoes = {}
+
+    @contextmanager
+    def etapa(self, nome):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.etapas[nome] = self.etapas.get(nome, 0.0) + time.perf_counter() - inicio
+
+    def contar(self, grupo, chave, quantidade=1):
+        contadores = self.contadores.setdefault(grupo, {})
+        contadores[chave] = contadores.get(chave, 0) + int(quantidade)
+
+    def registrar(self, chave, valor):
+        self.informacoes[chave] = valor
+
+    def como_dict(self):
+        return {
+            'inicio': self.inicio.isoformat(timespec='seconds'),
+            'duracao_total_s': round(time.perf_counter() - self._relogio, 6),
+            'etapas_s': {nome: round(segundos, 6) for nome, segundos in self.etapas.items()},
+            'contadores': self.contadores,
+            'informacoes': self.informacoes,
+        }
+
+    def salvar(self, caminho):
+        os.makedirs(os.path.dirname(caminho) or '.', exist_ok=True)
+        with open(caminho, 'w', encoding='UTF-8') as arquivo:
+            json.dump(self.como_dict(), arquivo, ensure_ascii=False, indent=2, default=str)
+        return caminho
+
+
+@contextmanager
+def perfilar(caminho=None):
+    """Roda o bloco sob o cProfile e grava as estatísticas em `caminho` (não faz nada se for None)."""
+    if not caminho:
+        yield
+        return
+    perfil = cProfile.Profile()
+    perfil.enable()
+    try:
+        yield
+    finally:
+        perfil.disable()
+        os.makedirs(os.path.dirname(caminho) or '.', exist_ok=True)
+        perfil.dump_stats(caminho)
@@ -0,0 +1,88 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from dados import EscritorTratados, calcular_metricas, tipar_tratados
+from instrumentacao import RelatorioExecucao
+
+PRECO_MINIMO = 0
+PRECO_MAXIMO = 999
+TAMANHO_BLOCO = 100_000
+
+
+def limpar_bloco(df, vistos, preco_min=PRECO_MINIMO, preco_max=PRECO_MAXIMO, relatorio=None):
+    """
+    Aplica o tratamento a um bloco da base bruta: nulos viram 0, linhas repetidas
+    (dentro do bloco ou já vistas em blocos anteriores) são removidas e os preços
+    são limitados ao intervalo [preco_min, preco_max]. No fim, as métricas derivadas
+    (preço por litro e valor da parcela) são calculadas.
+    `vistos` é o conjunto de hashes das linhas já mantidas e é atualizado aqui.
+    """
+    relatorio = relatorio or RelatorioExecucao()
+    relatorio.contar('limpeza', 'linhas_lidas', len(df))
+    relatorio.contar('limpeza', 'nulos_preenchidos', df.isna().sum().sum())
+    df = tipar_tratados(df.fillna(0))
+
+    # Tratando duplicatas
+    chaves = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    novas = ~pd.Series(chaves).duplicated().to_numpy()
+    novas &= np.fromiter((chave not in vistos for chave in chaves), dtype=bool, count=len(chaves))
+    vistos.update(chaves[novas].tolist())
+    relatorio.contar('limpeza', 'duplicatas_removidas', len(df) - novas.sum())
+    df = df[novas]
+
+    # Tratando outliers
+    acima = df['Precos'] > preco_max
+    abaixo = df['Precos'] < preco_min
+    relatorio.contar('limpeza', 'precos_limitados_max', acima.sum())
+    relatorio.contar('limpeza', 'precos_limitados_min', abaixo.sum())
+    df.loc[acima, 'Precos'] = preco_max
+    df.loc[abaixo, 'Precos'] = preco_min
+    df = calcular_metricas(df)
+    relatorio.contar('limpeza', 'linhas_gravadas', len(df))
+    return df
+
+
+def limpar_dataframe(df, preco_min=PRECO_MINIMO, preco_max=PRECO_MAXIMO, relatorio=None):
+    """Tratamento de uma base que já está inteira em memória."""
+    return limpar_bloco(df, set(), preco_min=preco_min, preco_max=preco_max, relatorio=relatorio)
+
+
+def limpar_arquivo(entrada, saida, tamanho_bloco=TAMANHO_BLOCO, preco_min=PRECO_MINIMO, preco_max=PRECO_MAXIMO,
+                   relatorio=None):
+    """
+    Lê a base bruta em blocos de `tamanho_bloco` linhas e grava cada bloco tratado
+    assim que fica pronto, então a memória usada não depende do tamanho do arquivo
+    (apenas o conjunto de hashes cresce com o número de linhas distintas).
+    """
+    vistos = set()
+    linhas_lidas = linhas_gravadas = 0
+    with EscritorTratados(saida) as escritor:
+        for bloco in pd.read_csv(entrada, sep=';', encoding='UTF-8', index_col=0, chunksize=tamanho_bloco):
+            linhas_lidas += len(bloco)
+            tratado = limpar_bloco(bloco, vistos, preco_min=preco_min, preco_max=preco_max, relatorio=relatorio)
+            escritor.escrever(tratado)
+            linhas_gravadas += len(tratado)
+    return linhas_lidas, linhas_gravadas
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Tratamento da base bruta de vinhos, em blocos.')
+    parser.add_argument('entrada', nargs='?', default='../bases_originais/dados_brutos.csv')
+    parser.add_argument('saida', nargs='?', default='../bases_tratadas/dados_tratados.csv')
+    parser.add_argument('--bloco', type=int, default=TAMANHO_BLOCO, help='linhas por bloco')
+    parser.add_argument('--preco-min', type=float, default=PRECO_MINIMO)
+    parser.add_argument('--preco-max', type=float, default=PRECO_MAXIMO)
+    parser.add_argument('--relatorio', default=None, help='grava tempos e contadores do tratamento em JSON')
+    args = parser.parse_args()
+
+    relatorio = RelatorioExecucao()
+    with relatorio.etapa('limpeza'):
+        lidas, gravadas = limpar_arquivo(args.entrada, args.saida, tamanho_bloco=args.bloco,
+                                         preco_min=args.preco_min, preco_max=args.preco_max, relatorio=relatorio)
+    print(f"{lidas} linhas lidas, {gravadas} linhas gravadas em {args.saida}.")
+    if args.relatorio:
+        relatorio.salvar(args.relatorio)
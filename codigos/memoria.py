@@ -0,0 +1,52 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+
+def tamanho_objeto(objeto, _vistos=None):
+    """
+    Estimativa em bytes da memória ocupada por um objeto em cache, somando DataFrames,
+    Series e arrays NumPy (com o conteúdo de strings) e percorrendo dicionários, listas e
+    atributos de objetos. Cada objeto é contado uma única vez.
+    """
+    vistos = _vistos if _vistos is not None else set()
+    if id(objeto) in vistos:
+        return 0
+    vistos.add(id(objeto))
+
+    if isinstance(objeto, pd.DataFrame):
+        return int(objeto.memory_usage(deep=True, index=True).sum())
+    if isinstance(objeto, (pd.Series, pd.Index)):
+        return int(objeto.memory_usage(deep=True))
+    if isinstance(objeto, np.ndarray):
+        return int(objeto.nbytes)
+    if isinstance(objeto, dict):
+        return sys.getsizeof(objeto) + sum(tamanho_objeto(chave, vistos) + tamanho_objeto(valor, vistos)
+                                           for chave, valor in objeto.items())
+    if isinstance(objeto, (list, tuple, set, frozenset)):
+        return sys.getsizeof(objeto) + sum(tamanho_objeto(item, vistos) for item in objeto)
+    if hasattr(objeto, '__dict__') and not isinstance(objeto, type):
+        return sys.getsizeof(objeto) + tamanho_objeto(vars(objeto), vistos)
+    return sys.getsizeof(objeto)
+
+
+def memoria_por_coluna(df):
+    """Bytes e tipo de cada coluna (e do índice) do DataFrame."""
+    uso = df.memory_usage(deep=True, index=True)
+    tipos = df.dtypes.astype(str).reindex(uso.index).fillna(str(df.index.dtype))
+    return pd.DataFrame({'Coluna': uso.index, 'Tipo': tipos.to_numpy(), 'Bytes': uso.to_numpy()})
+
+
+def memoria_objetos(objetos):
+    """Bytes de cada objeto em cache, a partir de um dicionário nome -> objeto."""
+    return pd.DataFrame({'Objeto': list(objetos), 'Bytes': [tamanho_objeto(o) for o in objetos.values()]})
+
+
+def formatar_bytes(quantidade):
+    for unidade in ('B', 'KB', 'MB', 'GB'):
+        if quantidade < 1024 or unidade == 'GB':
+            return f'{quantidade:.1f} {unidade}' if unidade != 'B' else f'{quantidade} B'
+        quantidade /= 1024
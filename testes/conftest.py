@@ -0,0 +1,81 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+PASTA_TESTES = os.path.dirname(os.path.abspath(__file__))
+PASTA_PAGINAS = os.path.join(PASTA_TESTES, 'paginas')
+
+# Os módulos ficam soltos em codigos/ e se importam pelo nome, como quando rodados de lá
+sys.path.insert(0, os.path.join(PASTA_TESTES, '..', 'codigos'))
+
+
+def ler_pagina(nome):
+    with open(os.path.join(PASTA_PAGINAS, nome), encoding='UTF-8') as arquivo:
+        return arquivo.read()
+
+
+@pytest.fixture
+def pagina_div14():
+    return ler_pagina('best_buys_div14.html')
+
+
+@pytest.fixture
+def pagina_div15():
+    return ler_pagina('best_buys_div15.html')
+
+
+class ServidorLocal:
+    """
+    Servidor HTTP local que faz o papel do site nos testes. `responder(caminho, parametros)`
+    devolve (status, html) ou (status, html, atraso_s); cada requisição fica registrada
+    em `requisicoes` como (caminho, parametros).
+    """
+
+    def __init__(self):
+        self.requisicoes = []
+        self.responder = lambda caminho, parametros: (404, '')
+        self._trava = threading.Lock()
+        servidor_local = self
+
+        class Manipulador(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, formato, *args):
+                pass
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                parametros = {chave: valores[-1] for chave, valores in parse_qs(url.query).items()}
+                with servidor_local._trava:
+                    servidor_local.requisicoes.append((url.path, parametros))
+                status, corpo, *atraso = servidor_local.responder(url.path, parametros)
+                if atraso:
+                    threading.Event().wait(atraso[0])
+                dados = corpo.encode('UTF-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(dados)))
+                self.end_headers()
+                self.wfile.write(dados)
+
+        self._servidor = ThreadingHTTPServer(('127.0.0.1', 0), Manipulador)
+        self.url = f'http://127.0.0.1:{self._servidor.server_address[1]}'
+        self._thread = threading.Thread(target=self._servidor.serve_forever, daemon=True)
+        self._thread.start()
+
+    def encerrar(self):
+        self._servidor.shutdown()
+        self._servidor.server_close()
+
+
+@pytest.fixture
+def servidor():
+    servidor_local = ServidorLocal()
+    yield servidor_local
+    servidor_local.encerrar()
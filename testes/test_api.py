@@ -0,0 +1,107 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import json
+import os
+import threading
+from http.server import ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+import requests
+
+import api as modulo_api
+from api import BaseConsultas, Manipulador
+from dados import caminho_versao, salvar_tratados
+from limpeza import limpar_dataframe
+
+
+def _base(n):
+    bruto = pd.DataFrame({'Produto': [f'Vinho {i}' for i in range(n)], 'Volume (ML)': [750.0] * n,
+                          'Precos': [float(100 + i) for i in range(n)], 'Parcela': [float(2 + i % 2) for i in range(n)]})
+    return limpar_dataframe(bruto)
+
+
+@pytest.fixture
+def api(tmp_path):
+    caminho = str(tmp_path / 'dados_tratados.csv')
+    salvar_tratados(_base(5), caminho)
+    Manipulador.base = BaseConsultas(caminho)
+    Manipulador.protocol_version = 'HTTP/1.1'
+    servidor = ThreadingHTTPServer(('127.0.0.1', 0), Manipulador)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{servidor.server_address[1]}', caminho
+    servidor.shutdown()
+    servidor.server_close()
+
+
+def test_resumo_com_etag(api):
+    url, _ = api
+    resposta = requests.get(f'{url}/resumo')
+    assert resposta.json()['linhas'] == 5
+    assert resposta.json()['preco_medio'] == 102.0
+
+    repetida = requests.get(f'{url}/resumo', headers={'If-None-Match': resposta.headers['ETag']})
+    assert repetida.status_code == 304
+
+
+def test_nova_versao_troca_resposta_e_etag(api):
+    url, caminho = api
+    antes = requests.get(f'{url}/parcelas')
+    versao = salvar_tratados(_base(8), caminho)
+    depois = requests.get(f'{url}/parcelas', headers={'If-None-Match': antes.headers['ETag']})
+
+    assert depois.status_code == 200
+    assert depois.json()['versao'] == versao
+    assert depois.json()['parcelas'] == [{'parcelas': 2, 'vinhos': 4}, {'parcelas': 3, 'vinhos': 4}]
+
+
+def test_ranking_e_linhas(api):
+    url, _ = api
+    assert [v['Precos'] for v in requests.get(f'{url}/ranking?ordem=menores&n=2').json()['vinhos']] == [100.0, 101.0]
+    assert requests.get(f'{url}/ranking?ordem=outra').status_code == 400
+
+    resposta = requests.get(f'{url}/linhas?pagina=2&tamanho=2')
+    assert resposta.headers['Transfer-Encoding'] == 'chunked'
+    linhas = [json.loads(l) for l in resposta.text.splitlines()]
+    assert [l['Produto'] for l in linhas] == ['Vinho 2', 'Vinho 3']
+    assert len(requests.get(f'{url}/linhas?tamanho=2&todas=1').text.splitlines()) == 5
+
+
+def test_versao_e_base_sempre_da_mesma_publicacao(api):
+    url, caminho = api
+    linhas_por_versao = {}
+    inconsistentes = []
+    parar = threading.Event()
+
+    def consultar():
+        with requests.Session() as sessao:
+            while not parar.is_set():
+                corpo = sessao.get(f'{url}/resumo').json()
+                esperado = linhas_por_versao.get(corpo['versao'])
+                if esperado is not None and esperado != corpo['linhas']:
+                    inconsistentes.append(corpo)
+
+    linhas_por_versao[Manipulador.base.atual()[0]] = 5
+    threads = [threading.Thread(target=consultar) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for n in range(6, 16):
+        linhas_por_versao[salvar_tratados(_base(n), caminho)] = n
+    parar.set()
+    for thread in threads:
+        thread.join()
+    assert inconsistentes == []
+
+
+def test_sem_arquivo_de_token_a_base_e_carregada_uma_vez(api, monkeypatch):
+    url, caminho = api
+    cargas = []
+    carregar = modulo_api.carregar_tratados
+    monkeypatch.setattr(modulo_api, 'carregar_tratados', lambda *a, **k: cargas.append(1) or carregar(*a, **k))
+    os.remove(caminho_versao(caminho))
+
+    respostas = [requests.get(f'{url}/resumo') for _ in range(5)]
+    assert len(cargas) == 1
+    # O corpo continua identificado pelo token gravado no Feather
+    assert len({r.json()['versao'] for r in respostas}) == 1
+    assert requests.get(f'{url}/resumo', headers={'If-None-Match': respostas[0].headers['ETag']}).status_code == 304
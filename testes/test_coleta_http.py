@@ -0,0 +1,101 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import pandas as pd
+import pytest
+import requests
+
+from coleta_http import coletar_http, criar_sessao, parametro_pagina, parametros_ordem
+from conftest import ler_pagina
+from extracao import COLUNAS, extrair_produtos
+from instrumentacao import RelatorioExecucao
+
+PAGINA = ler_pagina('best_buys_servidor.html')
+PAGINA_MENOR_PRECO = ler_pagina('best_buys_servidor_menor_preco.html')
+
+
+def _site(caminho, parametros):
+    """Listagem por relevância; ordenada por preço quando recebe o parâmetro do selectOrdem."""
+    if caminho != '/especiais/best-buys':
+        return 404, ''
+    return 200, PAGINA_MENOR_PRECO if parametros.get('order') == 'preco_asc' else PAGINA
+
+
+def test_parametros_ordem_lidos_do_select():
+    assert parametros_ordem(PAGINA) == {'order': 'preco_asc'}
+    assert parametros_ordem(PAGINA, opcao=3) == {'order': 'preco_desc'}
+    assert parametros_ordem(PAGINA, opcao=9) is None
+    assert parametros_ordem('<html><body><p>sem select</p></body></html>') is None
+
+
+def test_parametro_pagina_lido_dos_links():
+    assert parametro_pagina(PAGINA) == 'pagina'
+    # Só o link "2" (sem rel="next"), com outro parâmetro na mesma consulta
+    assert parametro_pagina('<html><body><a href="/v?order=preco_asc&amp;p=2">2</a></body></html>') == 'p'
+    assert parametro_pagina('<html><body><a href="/v?id=2">Vinho 2</a></body></html>') is None
+    assert parametro_pagina('') is None
+
+
+def test_html_do_servidor_precisa_do_seletor_estrutural():
+    # Sem as divs inseridas pelos scripts, as posições div[14]/div[15] não acham nada
+    assert extrair_produtos(PAGINA) == []
+    assert len(extrair_produtos(PAGINA, estrutural=True)) == 4
+
+
+def test_coleta_com_ordenacao_do_site(servidor):
+    servidor.responder = _site
+    relatorio = RelatorioExecucao()
+    tabela = coletar_http(f'{servidor.url}/especiais/best-buys', sessao=criar_sessao(), relatorio=relatorio)
+
+    assert servidor.requisicoes == [('/especiais/best-buys', {}), ('/especiais/best-buys', {'order': 'preco_asc'})]
+    assert relatorio.informacoes['ordenacao'] == 'site'
+    assert list(tabela.columns) == COLUNAS
+    assert pd.api.types.is_string_dtype(tabela['Produto'])
+    assert tabela.dtypes[['Volume (ML)', 'Precos', 'Parcela']].tolist() == [pd.Int64Dtype(), 'float64',
+                                                                          pd.Int64Dtype()]
+    assert tabela['Precos'].tolist() == [124.0, 149.0, 149.0, 249.0]
+    # Cada linha mantém os campos do próprio card, inclusive os ausentes
+    linhas = tabela.set_index('Produto')
+    assert pd.isna(linhas.loc['Altano Douro Tinto 2021', 'Volume (ML)'])
+    assert linhas.loc['Altano Douro Tinto 2021', 'Parcela'] == 2
+    assert pd.isna(linhas.loc['Los Vascos Cromas Gran Reserva Cabe...', 'Parcela'])
+    assert linhas.loc['Los Vascos Cromas Gran Reserva Cabe...', 'Precos'] == 249.0
+
+
+def test_site_ignora_parametro_e_a_tabela_e_ordenada_localmente(servidor):
+    servidor.responder = lambda caminho, parametros: (200, PAGINA)
+    relatorio = RelatorioExecucao()
+    tabela = coletar_http(f'{servidor.url}/especiais/best-buys', sessao=criar_sessao(), relatorio=relatorio,
+                          limite=3)
+
+    assert servidor.requisicoes[-1][1] == {'order': 'preco_asc'}
+    assert relatorio.informacoes['ordenacao'] == 'local'
+    assert tabela['Produto'].tolist() == ['Lagoalva Tinto 2021', 'Altano Douro Tinto 2021',
+                                          'Luis Pato Maria Gomes 2023']
+
+
+def test_sessao_repete_erros_transitorios(servidor):
+    respostas = iter([(503, ''), (503, '')])
+    servidor.responder = lambda caminho, parametros: next(respostas, (200, PAGINA_MENOR_PRECO))
+    sessao = criar_sessao(tentativas=3)
+    sessao.adapters['http://'].max_retries.backoff_factor = 0
+
+    tabela = coletar_http(f'{servidor.url}/especiais/best-buys', sessao=sessao)
+    assert len(tabela) == 4
+    assert len(servidor.requisicoes) == 4
+
+
+def test_erro_persistente_vira_excecao(servidor):
+    servidor.responder = lambda caminho, parametros: (500, '')
+    sessao = criar_sessao(tentativas=1)
+    sessao.adapters['http://'].max_retries.backoff_factor = 0
+
+    with pytest.raises(requests.RequestException):
+        coletar_http(f'{servidor.url}/especiais/best-buys', sessao=sessao)
+
+
+def test_resposta_vazia_vira_tabela_vazia(servidor):
+    servidor.responder = lambda caminho, parametros: (200, '')
+    tabela = coletar_http(f'{servidor.url}/especiais/best-buys', sessao=criar_sessao())
+
+    assert tabela.empty
+    assert list(tabela.columns) == COLUNAS
@@ -0,0 +1,164 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import csv
+import json
+import re
+
+from conftest import ler_pagina
+from crawler import rastrear
+
+# Os links de paginação usam "pg", e não o "pagina" da notação do checkpoint: o crawler
+# precisa descobrir o nome a partir da página 1
+MODELO = ler_pagina('best_buys_servidor.html').replace('?pagina=', '?pg=')
+CARDS_POR_PAGINA = 4
+
+
+def _pagina(categoria, numero):
+    """Listagem com os cards do modelo renomeados para identificar categoria e página."""
+    contador = iter(range(CARDS_POR_PAGINA))
+    return re.sub(r'<h2>[^<]*</h2>', lambda _: f'<h2>{categoria} p{numero} v{next(contador)}</h2>', MODELO)
+
+
+def _numero(parametros):
+    return int(parametros.get('pg', 1))
+
+
+PAGINA_VAZIA = re.sub(r'<div class="produtos">.*?\n          </div>\n', '<div class="produtos"></div>\n',
+                      MODELO, flags=re.S)
+
+
+def _site(paginas, erros=None, lentas=()):
+    """
+    `paginas` = {categoria: total de páginas}; depois da última, a categoria 'vinhos' responde 404
+    e as demais uma página sem produtos. `erros` = {(categoria, página): [status, ...]} consumidos
+    um por requisição antes da resposta normal.
+    """
+    erros = {chave: list(status) for chave, status in (erros or {}).items()}
+
+    def responder(caminho, parametros):
+        categoria, numero = caminho.strip('/'), _numero(parametros)
+        pendentes = erros.get((categoria, numero))
+        if pendentes:
+            return pendentes.pop(0), 'erro'
+        if numero > paginas[categoria]:
+            return (404, '') if categoria == 'vinhos' else (200, PAGINA_VAZIA)
+        atraso = 0.2 if (categoria, numero) in lentas else 0
+        return 200, _pagina(categoria, numero), atraso
+
+    return responder
+
+
+def _ler_csv(caminho):
+    with open(caminho, encoding='UTF-8') as arquivo:
+        return list(csv.DictReader(arquivo, delimiter=';'))
+
+
+def _rastrear(servidor, tmp_path, **opcoes):
+    return rastrear(['/vinhos', '/espumantes'], str(tmp_path / 'catalogo.csv'),
+                    checkpoint=str(tmp_path / 'checkpoint.json'), trabalhadores=3, taxa=1000,
+                    url_base=servidor.url, tentativas=3, espera_base=0, **opcoes)
+
+
+def test_paginacao_termina_em_404_e_pagina_vazia(servidor, tmp_path):
+    servidor.responder = _site({'vinhos': 3, 'espumantes': 2}, erros={('vinhos', 2): [503, 502]},
+                               lentas={('espumantes', 1)})
+    resultado = _rastrear(servidor, tmp_path)
+
+    assert resultado['falhas'] == []
+    assert resultado['paginas'] == 5
+    assert resultado['linhas'] == 5 * CARDS_POR_PAGINA
+    # A página com 5xx foi repetida até dar certo
+    assert servidor.requisicoes.count(('/vinhos', {'pg': '2'})) == 3
+    # A página 1 vai sem parâmetro de página
+    assert ('/vinhos', {}) in servidor.requisicoes
+
+    linhas = _ler_csv(tmp_path / 'catalogo.csv')
+    assert sorted({(l['Categoria'], l['Produto'].split()[1]) for l in linhas}) == [
+        ('/espumantes', 'p1'), ('/espumantes', 'p2'), ('/vinhos', 'p1'), ('/vinhos', 'p2'), ('/vinhos', 'p3')]
+    assert [int(l['']) for l in linhas] == list(range(len(linhas)))
+    # Cada linha traz os campos do próprio card
+    altano = next(l for l in linhas if l['Produto'] == 'vinhos p1 v2')
+    assert (altano['Volume (ML)'], altano['Precos'], altano['Parcela']) == ('', '149.0', '2')
+
+    estado = json.loads((tmp_path / 'checkpoint.json').read_text(encoding='UTF-8'))
+    assert estado['finalizadas'] == ['/espumantes', '/vinhos']
+
+
+def test_falha_persistente_e_retomada_pelo_checkpoint(servidor, tmp_path):
+    servidor.responder = _site({'vinhos': 3, 'espumantes': 1}, erros={('vinhos', 2): [500] * 3})
+    resultado = _rastrear(servidor, tmp_path)
+
+    assert [(f['categoria'], f['pagina']) for f in resultado['falhas']] == [('/vinhos', 2)]
+    assert '500' in resultado['falhas'][0]['erro']
+    assert resultado['linhas'] == 3 * CARDS_POR_PAGINA
+    estado = json.loads((tmp_path / 'checkpoint.json').read_text(encoding='UTF-8'))
+    # Com uma página faltando, a categoria não é dada como finalizada
+    assert estado['finalizadas'] == ['/espumantes']
+    assert '/vinhos?pagina=2' not in estado['concluidas']
+
+    servidor.requisicoes.clear()
+    servidor.responder = _site({'vinhos': 3, 'espumantes': 1})
+    resultado = _rastrear(servidor, tmp_path)
+
+    assert resultado['falhas'] == []
+    assert resultado['linhas'] == 4 * CARDS_POR_PAGINA
+    # Só a página que faltava (e as que confirmam o fim) foi pedida de novo
+    pedidas = {(caminho, _numero(parametros)) for caminho, parametros in servidor.requisicoes}
+    assert ('/vinhos', 2) in pedidas
+    assert not pedidas & {('/vinhos', 1), ('/vinhos', 3)}
+    assert all(caminho == '/vinhos' for caminho, _ in pedidas)
+
+    produtos = [l['Produto'] for l in _ler_csv(tmp_path / 'catalogo.csv')]
+    assert len(produtos) == len(set(produtos)) == 4 * CARDS_POR_PAGINA
+    estado = json.loads((tmp_path / 'checkpoint.json').read_text(encoding='UTF-8'))
+    assert estado['finalizadas'] == ['/espumantes', '/vinhos']
+
+
+def test_max_paginas(servidor, tmp_path):
+    servidor.responder = _site({'vinhos': 5, 'espumantes': 5})
+    resultado = _rastrear(servidor, tmp_path, max_paginas=2)
+
+    assert resultado['paginas'] == 4
+    assert max(_numero(parametros) for _, parametros in servidor.requisicoes) == 2
+
+
+def test_site_que_ignora_o_parametro_de_pagina(servidor, tmp_path):
+    # Toda requisição recebe a página 1: a segunda página repete os produtos e encerra a categoria
+    servidor.responder = lambda caminho, parametros: (200, _pagina(caminho.strip('/'), 1))
+    resultado = _rastrear(servidor, tmp_path)
+
+    assert resultado['falhas'] == []
+    assert resultado['linhas'] == 2 * CARDS_POR_PAGINA
+    produtos = [l['Produto'] for l in _ler_csv(tmp_path / 'catalogo.csv')]
+    assert len(produtos) == len(set(produtos))
+    assert len(servidor.requisicoes) < 10
+    estado = json.loads((tmp_path / 'checkpoint.json').read_text(encoding='UTF-8'))
+    assert estado['finalizadas'] == ['/espumantes', '/vinhos']
+
+
+def test_listagem_sem_links_de_paginacao(servidor, tmp_path):
+    sem_links = re.sub(r'<nav class="paginacao">.*?</nav>', '', MODELO, flags=re.S)
+    servidor.responder = lambda caminho, parametros: (200, sem_links)
+    resultado = _rastrear(servidor, tmp_path)
+
+    assert resultado['paginas'] == 2
+    assert all(parametros == {} for _, parametros in servidor.requisicoes)
+    assert len(servidor.requisicoes) == 2
+
+
+def test_resposta_vazia_vira_falha_da_pagina(servidor, tmp_path):
+    site = _site({'vinhos': 3, 'espumantes': 1})
+    servidor.responder = lambda caminho, parametros: (
+        (200, '') if (caminho, _numero(parametros)) == ('/vinhos', 2) else site(caminho, parametros))
+    resultado = _rastrear(servidor, tmp_path)
+
+    # As outras páginas seguem normalmente e a categoria não é dada como completa
+    assert [(f['categoria'], f['pagina']) for f in resultado['falhas']] == [('/vinhos', 2)]
+    assert resultado['linhas'] == 3 * CARDS_POR_PAGINA
+    estado = json.loads((tmp_path / 'checkpoint.json').read_text(encoding='UTF-8'))
+    assert estado['finalizadas'] == ['/espumantes']
+
+    servidor.responder = site
+    resultado = _rastrear(servidor, tmp_path)
+    assert resultado['falhas'] == []
+    assert resultado['linhas'] == 4 * CARDS_POR_PAGINA
@@ -0,0 +1,38 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import math
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from dados import carregar_tratados, compactar_tabela, ler_versao, salvar_tratados
+from limpeza import limpar_dataframe
+
+
+def test_compactar_tabela_usa_tipos_menores():
+    tabela = pa.table({'Produto': ['a', 'b', 'a'], 'Parcela': [2, 3, 2], 'Precos': [1.5, math.inf, None]})
+    compacta = compactar_tabela(tabela)
+
+    assert pa.types.is_dictionary(compacta.schema.field('Produto').type)
+    assert compacta.schema.field('Parcela').type == pa.int16()
+    # inf e nulos já existentes passam; só valores finitos fora da faixa são recusados
+    assert compacta.column('Precos').to_pylist() == [1.5, math.inf, None]
+
+
+@pytest.mark.parametrize('coluna, valor', [('Parcela', 40_000), ('Precos', 1e40), ('Preco por Litro', -1e39)])
+def test_compactar_tabela_recusa_valor_fora_da_faixa(coluna, valor):
+    with pytest.raises(pa.ArrowInvalid):
+        compactar_tabela(pa.table({coluna: [1.0 if coluna != 'Parcela' else 1, valor]}))
+
+
+def test_salvar_e_carregar_compacto(tmp_path):
+    bruto = pd.DataFrame({'Produto': ['Lagoalva Tinto 2021', 'Altano 2021'], 'Volume (ML)': [750.0, None],
+                          'Precos': [124.0, 149.0], 'Parcela': [2.0, None]})
+    caminho = str(tmp_path / 'dados_tratados.csv')
+    versao = salvar_tratados(limpar_dataframe(bruto), caminho)
+
+    assert ler_versao(caminho) == versao
+    df = carregar_tratados(caminho, compacto=True)
+    assert str(df['Precos'].dtype) == 'float32' and str(df['Parcela'].dtype) == 'int16'
+    assert df['Preco por Litro'].iloc[0] == pytest.approx(124.0 / 0.75)
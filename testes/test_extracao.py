@@ -0,0 +1,52 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+from extracao import COLUNAS, extrair_produtos, montar_tabela
+from instrumentacao import RelatorioExecucao
+
+
+def test_listagem_em_div14(pagina_div14):
+    relatorio = RelatorioExecucao()
+    registros = extrair_produtos(pagina_div14, relatorio=relatorio)
+
+    assert len(registros) == 4
+    assert relatorio.contadores['cards_por_listagem'] == {'div[14]': 4, 'div[15]': 0}
+    assert registros[0] == {'Produto': 'Lagoalva Tinto 2021', 'Volume (ML)': 750, 'Precos': 124.0, 'Parcela': 2}
+
+
+def test_listagem_em_div15(pagina_div15):
+    relatorio = RelatorioExecucao()
+    registros = extrair_produtos(pagina_div15, relatorio=relatorio)
+
+    assert [r['Produto'] for r in registros] == ['Petit Caro 2021', 'Catena Malbec 2022']
+    assert relatorio.contadores['cards_por_listagem'] == {'div[14]': 0, 'div[15]': 2}
+
+
+def test_campo_ausente_nao_desalinha_as_linhas(pagina_div14):
+    relatorio = RelatorioExecucao()
+    tabela = montar_tabela(extrair_produtos(pagina_div14, relatorio=relatorio))
+
+    assert list(tabela.columns) == COLUNAS
+    # Card sem parcelamento (pagamento à vista): só a Parcela fica nula
+    cromas = tabela.iloc[2]
+    assert cromas['Produto'] == 'Los Vascos Cromas Gran Reserva Cabe...'
+    assert cromas['Volume (ML)'] == 750 and cromas['Precos'] == 249.0
+    assert cromas.isna()['Parcela']
+    # Card sem volume: o preço e a parcela continuam na linha do próprio vinho
+    altano = tabela.iloc[3]
+    assert altano['Produto'] == 'Altano Douro Tinto 2021'
+    assert altano.isna()['Volume (ML)']
+    assert altano['Precos'] == 149.0 and altano['Parcela'] == 2
+    assert relatorio.contadores['campo_Parcela'] == {'encontrado': 3, 'ausente': 1}
+    assert relatorio.contadores['campo_Volume (ML)'] == {'encontrado': 3, 'ausente': 1}
+
+
+def test_limite_de_cards(pagina_div14):
+    assert len(extrair_produtos(pagina_div14, limite=2)) == 2
+
+
+def test_pagina_vazia_nao_tem_cards():
+    relatorio = RelatorioExecucao()
+    assert extrair_produtos('', relatorio=relatorio) == []
+    assert extrair_produtos('  \n', estrutural=True) == []
+    assert relatorio.contadores['paginas'] == {'vazias': 1}
+    assert montar_tabela([]).empty
@@ -0,0 +1,61 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from filtros import IndiceFiltros
+
+
+@pytest.fixture
+def base():
+    """Base nos tipos compactos que o app carrega (float32, int16, categorias com nulo)."""
+    return pd.DataFrame({
+        'Produto': pd.Categorical(['Château Marjosse Rouge', 'Lagoalva Tinto', None, 'CHATEAU Lafite',
+                                   'Altano Douro', 'Lagoalva Tinto']),
+        'Volume (ML)': np.array([750, 750, 375, 1500, 0, 750], dtype='int32'),
+        'Precos': np.array([124.3, 199.99, 89.9, 999.0, 124.3, 0.1], dtype='float32'),
+        'Parcela': np.array([2, 3, 1, 10, 2, 1], dtype='int16'),
+        'Preco por Litro': np.array([165.73, 266.65, 239.73, 666.0, np.nan, 0.13], dtype='float32'),
+    })
+
+
+def _esperado(df, filtros):
+    """Os mesmos filtros aplicados direto nas colunas, como um usuário faria no pandas."""
+    mascara = pd.Series(True, index=df.index)
+    for filtro in filtros:
+        if filtro[0] == 'nome':
+            nomes = df['Produto'].astype(object)
+            dobrados = nomes.astype(str).str.normalize('NFKD').str.encode('ascii', 'ignore').str.decode('ascii')
+            mascara &= nomes.notna() & dobrados.str.lower().str.contains(filtro[1].lower(), regex=False)
+        else:
+            coluna, minimo, maximo = filtro
+            mascara &= (df[coluna] >= minimo) & (df[coluna] <= maximo)
+    return mascara.to_numpy()
+
+
+@pytest.mark.parametrize('filtros', [
+    (),
+    (('Precos', 100.0, 500.0),),
+    # Limites que não existem em float32: a comparação é feita no tipo da coluna
+    (('Precos', 124.3, 124.3),),
+    (('Precos', 89.9, 199.99),),
+    (('Preco por Litro', 0.0, 300.0),),
+    (('Volume (ML)', 750, 750), ('Parcela', 2, 10)),
+    (('nome', 'chateau'),),
+    (('nome', 'Lagoalva'), ('Precos', 150.0, 999.0)),
+    (('nome', 'none'),),
+])
+def test_mascara_igual_ao_filtro_direto(base, filtros):
+    np.testing.assert_array_equal(IndiceFiltros(base).mascara(filtros), _esperado(base, filtros))
+
+
+def test_limites_da_coluna_incluem_as_pontas(base):
+    indice = IndiceFiltros(base)
+    for coluna in indice.colunas:
+        minimo, maximo = indice.limites(coluna)
+        filtros = ((coluna, minimo, maximo),)
+        # Só os nulos ficam de fora do intervalo completo devolvido pelo slider
+        np.testing.assert_array_equal(indice.mascara(filtros), base[coluna].notna().to_numpy())
+        np.testing.assert_array_equal(indice.mascara(filtros), _esperado(base, filtros))
+    assert indice.limites('Preco por Litro') == (pytest.approx(0.13), pytest.approx(666.0))
@@ -0,0 +1,93 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import hashlib
+import os
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from historico import (ESQUEMA_HISTORICO, MARCADOR_IDS, anexar_coleta, compactar, historico_produto,
+                       migrar_ids, ultima_coleta)
+from identidade import ResolvedorIdentidade
+
+
+def _coleta(preco):
+    return pd.DataFrame({'Produto': ['Lagoalva Tinto 2021', 'Château Marjosse Rouge 2022'],
+                         'Volume (ML)': [750, None], 'Precos': [preco, 199.0], 'Parcela': [2, 3]})
+
+
+def _gravar_formato_antigo(raiz, df, instante):
+    """Partição como era gravada antes do resolvedor: hash do nome em minúsculas e volume '' se nulo."""
+    def id_antigo(nome, volume):
+        volume = '' if pd.isna(volume) else int(volume)
+        chave = f"{' '.join(str(nome).lower().split())}|{volume}"
+        return hashlib.sha1(chave.encode('UTF-8')).hexdigest()[:16]
+
+    df = df.assign(id_produto=[id_antigo(n, v) for n, v in zip(df['Produto'], df['Volume (ML)'])],
+                   coletado_em=pd.Timestamp(instante))
+    pasta = os.path.join(raiz, f'data_coleta={instante:%Y-%m-%d}')
+    os.makedirs(pasta)
+    tabela = pa.Table.from_pandas(df[ESQUEMA_HISTORICO.names], schema=ESQUEMA_HISTORICO, preserve_index=False)
+    pq.write_table(tabela, os.path.join(pasta, 'parte-antiga.parquet'))
+
+
+def test_migracao_liga_coletas_antigas_aos_ids_atuais(tmp_path):
+    raiz = str(tmp_path / 'historico')
+    _gravar_formato_antigo(raiz, _coleta(124.0), datetime(2025, 3, 1, 10))
+    resolvedor = ResolvedorIdentidade()
+
+    assert migrar_ids(raiz, resolvedor=resolvedor) == 1
+    assert os.path.exists(os.path.join(raiz, MARCADOR_IDS))
+    anexar_coleta(_coleta(119.0), raiz=raiz, instante=datetime(2025, 3, 2, 10), resolvedor=resolvedor)
+
+    for produto in ('Lagoalva Tinto 2021', 'Château Marjosse Rouge 2022'):
+        id_atual = resolvedor.resolver(produto, 750 if produto.startswith('Lagoalva') else None)
+        assert len(historico_produto(id_atual, raiz=raiz)) == 2
+    assert historico_produto(resolvedor.resolver('Lagoalva Tinto 2021', 750), raiz=raiz)['Precos'].tolist() == [
+        124.0, 119.0]
+    assert ultima_coleta(raiz)['Precos'].tolist() == [119.0, 199.0]
+
+
+def test_migracao_roda_uma_vez(tmp_path):
+    raiz = str(tmp_path / 'historico')
+    _gravar_formato_antigo(raiz, _coleta(124.0), datetime(2025, 3, 1, 10))
+
+    assert migrar_ids(raiz) == 1
+    assert migrar_ids(raiz) == 0
+
+
+def test_historico_novo_nao_tem_o_que_migrar(tmp_path):
+    raiz = str(tmp_path / 'historico')
+    assert migrar_ids(raiz) == 0
+    assert os.path.exists(os.path.join(raiz, MARCADOR_IDS))
+
+
+def _arquivos(raiz, data):
+    return [nome for nome in os.listdir(os.path.join(raiz, f'data_coleta={data}')) if nome.endswith('.parquet')]
+
+
+def test_compactacao_preserva_as_leituras(tmp_path):
+    raiz = str(tmp_path / 'historico')
+    resolvedor = ResolvedorIdentidade()
+    for instante, preco in [(datetime(2025, 3, 1, 9), 130.0), (datetime(2025, 3, 1, 18), 124.0),
+                            (datetime(2025, 3, 2, 9), 121.0), (datetime(2025, 3, 2, 18), 119.0)]:
+        anexar_coleta(_coleta(preco), raiz=raiz, instante=instante, resolvedor=resolvedor)
+    lagoalva = resolvedor.resolver('Lagoalva Tinto 2021', 750)
+    marjosse = resolvedor.resolver('Château Marjosse Rouge 2022', None)
+    antes = (ultima_coleta(raiz), historico_produto(lagoalva, raiz=raiz), historico_produto(marjosse, raiz=raiz))
+
+    # Só os dias anteriores a `antes_de`; o dia que ainda recebe coletas fica como está
+    assert compactar(raiz, antes_de='2025-03-02') == 1
+    assert len(_arquivos(raiz, '2025-03-01')) == 1
+    assert len(_arquivos(raiz, '2025-03-02')) == 2
+    assert compactar(raiz) == 1
+    assert len(_arquivos(raiz, '2025-03-02')) == 1
+    assert compactar(raiz) == 0
+
+    pd.testing.assert_frame_equal(ultima_coleta(raiz).sort_values('Produto').reset_index(drop=True),
+                                  antes[0].sort_values('Produto').reset_index(drop=True))
+    pd.testing.assert_frame_equal(historico_produto(lagoalva, raiz=raiz), antes[1])
+    pd.testing.assert_frame_equal(historico_produto(marjosse, raiz=raiz), antes[2])
+    assert antes[1]['Precos'].tolist() == [130.0, 124.0, 121.0, 119.0]
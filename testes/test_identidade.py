@@ -0,0 +1,103 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import gc
+import random
+import time
+
+from identidade import ResolvedorIdentidade, id_estavel, normalizar_produto, trigramas
+
+CORTADO = 'Los Vascos Cromas Gran Reserva ...'
+CABERNET = 'Los Vascos Cromas Gran Reserva Cabernet Sauvignon 2021'
+CARMENERE = 'Los Vascos Cromas Gran Reserva Carmenere 2021'
+
+
+def test_normalizacao():
+    assert normalizar_produto('Château Marjosse Rouge 2022') == 'chateau marjosse rouge'
+    assert normalizar_produto(None) == ''
+
+
+def test_variacoes_do_mesmo_nome_recebem_o_mesmo_id():
+    resolvedor = ResolvedorIdentidade()
+    assert resolvedor.resolver('Lagoalva Tinto 2021', 750) == resolvedor.resolver('LAGOALVA  Tinto 2022', 750)
+    assert resolvedor.resolver('Lagoalva Tinto 2021', 750) != resolvedor.resolver('Lagoalva Tinto 2021', 375)
+
+
+def test_nome_cortado_primeiro_nao_junta_finais_diferentes():
+    resolvedor = ResolvedorIdentidade()
+    cortado = resolvedor.resolver(CORTADO, 750)
+    cabernet = resolvedor.resolver(CABERNET, 750)
+    carmenere = resolvedor.resolver(CARMENERE, 750)
+
+    # O nome cortado é ligado ao primeiro nome completo compatível, e só a ele
+    assert cabernet == cortado
+    assert carmenere != cabernet
+    assert resolvedor.resolver(CORTADO, 750) == cortado
+
+
+def test_nome_cortado_ambiguo_vira_produto_proprio():
+    resolvedor = ResolvedorIdentidade()
+    cabernet = resolvedor.resolver(CABERNET, 750)
+    carmenere = resolvedor.resolver(CARMENERE, 750)
+    cortado = resolvedor.resolver(CORTADO, 750)
+
+    assert cabernet != carmenere
+    assert cortado not in (cabernet, carmenere)
+
+
+def test_nome_cortado_com_um_unico_produto_compativel():
+    resolvedor = ResolvedorIdentidade()
+    cabernet = resolvedor.resolver(CABERNET, 750)
+    carmenere = resolvedor.resolver(CARMENERE, 750)
+
+    # Como aparece na base coletada: o final que sobra ainda separa os dois vinhos
+    assert resolvedor.resolver('Los Vascos Cromas Gran Reserva Cabe...', 750) == cabernet
+    assert resolvedor.resolver('Los Vascos Cromas Gran Reserva Carm...', 750) == carmenere
+
+
+def test_ligacao_do_nome_cortado_sobrevive_ao_salvar(tmp_path):
+    caminho = str(tmp_path / '_identidades.json')
+    resolvedor = ResolvedorIdentidade()
+    cortado = resolvedor.resolver(CORTADO, 750)
+    resolvedor.resolver(CABERNET, 750)
+    resolvedor.salvar(caminho)
+
+    recarregado = ResolvedorIdentidade.carregar(caminho)
+    assert recarregado.resolver(CABERNET, 750) == cortado
+    assert recarregado.resolver(CARMENERE, 750) != cortado
+
+
+def _nomes(n, semente):
+    """Nomes distintos montados de poucas partes, como os do catálogo: muitos trigramas em comum."""
+    rng = random.Random(semente)
+    produtores = ['Los Vascos', 'Casa Valduga', 'Château Marjosse', 'Quinta do Crasto', 'Catena Zapata']
+    silabas = ['ra', 've', 'lo', 'chi', 'mar', 'to', 'sa', 'qui', 'ne', 'ber', 'do', 'lia']
+    estilos = ['Tinto', 'Branco', 'Reserva', 'Gran Reserva', 'Malbec', 'Cabernet Sauvignon']
+    return {f'{rng.choice(produtores)} {"".join(rng.choices(silabas, k=4)).title()} {rng.choice(estilos)}'
+            for _ in range(n)}
+
+
+def _segundos_por_nome(conhecidos, consultas):
+    resolvedor = ResolvedorIdentidade()
+    for nome in conhecidos:
+        normalizado = normalizar_produto(nome)
+        resolvedor._indexar(id_estavel(normalizado, 750), normalizado, 750)
+    consultas = [(normalizar_produto(nome), trigramas(normalizar_produto(nome))) for nome in consultas]
+    melhor = float('inf')
+    gc.disable()
+    try:
+        for _ in range(5):
+            inicio = time.perf_counter()
+            for nome, grams in consultas:
+                resolvedor._semelhante(nome, grams, 750, False)
+            melhor = min(melhor, time.perf_counter() - inicio)
+    finally:
+        gc.enable()
+    return melhor / len(consultas)
+
+
+def test_custo_por_nome_nao_cresce_com_o_catalogo():
+    consultas = list(_nomes(300, semente=1))
+    pequeno = _segundos_por_nome(_nomes(2_000, semente=0), consultas)
+    grande = _segundos_por_nome(_nomes(16_000, semente=0), consultas)
+    # Oito vezes mais produtos conhecidos quase não mudam o custo de cada nome novo
+    assert grande < 3 * pequeno
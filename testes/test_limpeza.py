@@ -0,0 +1,52 @@
+# dupla: Larissa Mayumi Odani e Leonardo Moiano Lima
+
+import numpy as np
+import pandas as pd
+
+from dados import calcular_metricas, carregar_tratados, tipar_tratados
+from instrumentacao import RelatorioExecucao
+from limpeza import limpar_arquivo, limpar_dataframe
+
+
+def _bruto(n=60, semente=0):
+    """Base bruta com repetições espalhadas, nulos e preços fora do intervalo."""
+    rng = np.random.default_rng(semente)
+    nomes = np.array(['Lagoalva Tinto 2021', 'Altano Douro Tinto 2021', 'Château Marjosse Rouge 2022',
+                      'Los Vascos Cromas Gran Reserva Cabe...'])
+    df = pd.DataFrame({
+        'Produto': nomes[rng.integers(0, len(nomes), n)],
+        'Volume (ML)': rng.choice([750.0, 375.0, np.nan], n),
+        'Precos': rng.choice([124.0, 149.0, 1500.0, -5.0, np.nan], n),
+        'Parcela': rng.choice([2.0, 3.0, np.nan], n),
+    })
+    # Linhas do começo repetidas no fim do arquivo, longe do bloco original
+    return pd.concat([df, df.iloc[:10]], ignore_index=True)
+
+
+def _esperado(bruto, preco_min, preco_max):
+    """O tratamento feito de uma vez sobre a base inteira."""
+    df = tipar_tratados(bruto.fillna(0)).drop_duplicates()
+    df['Precos'] = df['Precos'].clip(preco_min, preco_max)
+    return calcular_metricas(df).reset_index(drop=True)
+
+
+def test_blocos_pequenos_dao_o_mesmo_resultado_da_base_inteira(tmp_path):
+    bruto = _bruto()
+    entrada = tmp_path / 'dados_brutos.csv'
+    bruto.to_csv(entrada, sep=';', index=True, encoding='UTF-8')
+    saida = str(tmp_path / 'dados_tratados.csv')
+    relatorio = RelatorioExecucao()
+
+    lidas, gravadas = limpar_arquivo(str(entrada), saida, tamanho_bloco=7, preco_min=0, preco_max=999,
+                                     relatorio=relatorio)
+
+    esperado = _esperado(bruto, 0, 999)
+    assert (lidas, gravadas) == (len(bruto), len(esperado))
+    assert relatorio.contadores['limpeza']['duplicatas_removidas'] == len(bruto) - len(esperado)
+    pd.testing.assert_frame_equal(carregar_tratados(saida), esperado, check_dtype=False)
+
+
+def test_limpar_dataframe_igual_ao_tratamento_da_base_inteira():
+    bruto = _bruto(semente=1)
+    pd.testing.assert_frame_equal(limpar_dataframe(bruto, preco_min=10, preco_max=150).reset_index(drop=True),
+                                  _esperado(bruto, 10, 150))